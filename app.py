@@ -3,12 +3,20 @@
 テキストの分析とトレンド抽出を行うFlaskアプリケーション。
 """
 
-from typing import Dict, List, Union
+from functools import lru_cache
+from itertools import repeat
+from operator import attrgetter
+from typing import Any, Dict, List
 
 from flask import Flask, Response, jsonify, render_template, request
 from flask_cors import CORS
 
-from backend.config.settings import STATIC_DIR, TEMPLATE_DIR
+from backend.config.settings import (
+    ANALYSIS_CACHE_MAX_TEXT_LENGTH,
+    ANALYSIS_CACHE_SIZE,
+    STATIC_DIR,
+    TEMPLATE_DIR,
+)
 from backend.constants.colors import GRAY, POS_COLORS
 from backend.core.database import get_db
 from backend.patterns import (
@@ -16,22 +24,74 @@ from backend.patterns import (
     split_sentences,
     tokenize_sentence,
 )
+from backend.patterns.tokenizer import Language, Token
 from backend.services.trend.analyzer import TrendAnalyzer
 from backend.services.trend.scoring.trend_scoring import TrendScoring
+from backend.services.trend.updater import TrendUpdateQueue
+from backend.utils.json_provider import OrjsonProvider
 from backend.utils.logger import setup_logger
 
 # アプリケーション初期化
 app = Flask(
     __name__, template_folder=str(TEMPLATE_DIR), static_folder=str(STATIC_DIR)
 )
+app.json = OrjsonProvider(app)  # レスポンスのシリアライズにorjsonを使用
 CORS(app)
 
 # ロガー設定
 logger = setup_logger()
 
-# サービス初期化
-analyzer = TrendAnalyzer()
-scoring = TrendScoring()
+# 品詞→色の辞書引きを事前に束縛（トークンごとの属性参照を省く）
+_POS_COLOR_GET = POS_COLORS.get
+
+# トークンの属性をまとめて取り出すC実装の呼び出し可能オブジェクト
+_TOKEN_FIELDS = attrgetter(
+    "text", "pos", "language", "is_compound", "original_form"
+)
+_LANGUAGE_NAME_GET = {lang: lang.name for lang in Language}.get
+
+# 分析結果（列指向）の項目名
+_RESULT_FIELDS = (
+    "word",
+    "pos",
+    "importance",
+    "color",
+    "language",
+    "is_compound",
+    "original_form",
+)
+
+
+@lru_cache(maxsize=None)
+def get_analyzer() -> TrendAnalyzer:
+    """トレンド分析サービスを取得する.
+
+    ワーカーの起動時間を抑えるため、初回呼び出し時に生成する。
+
+    Returns:
+        TrendAnalyzer: トレンド分析サービス
+    """
+    return TrendAnalyzer()
+
+
+@lru_cache(maxsize=None)
+def get_scoring() -> TrendScoring:
+    """トレンドスコアリングサービスを取得する.
+
+    Returns:
+        TrendScoring: トレンドスコアリングサービス
+    """
+    return TrendScoring()
+
+
+@lru_cache(maxsize=None)
+def get_trend_queue() -> TrendUpdateQueue:
+    """トレンド更新キューを取得する.
+
+    Returns:
+        TrendUpdateQueue: トレンド更新キュー
+    """
+    return TrendUpdateQueue(get_analyzer())
 
 
 @app.route("/")
@@ -60,44 +120,28 @@ def analyze() -> tuple[Response, int]:
         if not text:
             return jsonify({"error": "テキストが空です"}), 400
 
-        # テキストの前処理と分析
+        # テキストの前処理と分析（同一テキストの分析結果はキャッシュ）
         text = preprocess_text(text)
-        sentences = split_sentences(text)
-
-        # 分析結果
-        analysis_result: List[List[Dict[str, Union[str, float]]]] = []
-
-        for sentence in sentences:
-            words = tokenize_sentence(sentence)
-            sentence_analysis = []
-
-            for word in words:
-                # Tokenオブジェクトから必要な情報を抽出
-                word_info = {
-                    "word": word.text,
-                    "pos": word.pos,
-                    "importance": analyzer._identify_part_of_speech(str(word))[
-                        1
-                    ],
-                    "color": get_pos_color(word.pos),
-                    "language": str(word.language).split(".")[1]
-                    if word.language
-                    else "UNKNOWN",
-                    "is_compound": word.is_compound,
-                    "original_form": word.original_form,
-                }
-                sentence_analysis.append(word_info)
-
-            analysis_result.append(sentence_analysis)
-
-        # トレンドの更新
+        analysis_result = _analyze_text(text)
+
+        # 分析済みの単語と重要度からキーワードを選び、トレンドの更新は
+        # キューに積んでバックグラウンドでまとめて反映する
+        keywords = get_analyzer().select_keywords(
+            (word, importance)
+            for sentence in analysis_result
+            for word, importance in zip(
+                sentence["word"], sentence["importance"]
+            )
+        )
+        get_trend_queue().put(keywords)
+        # 画面表示用のトレンドはキャッシュ済みのスナップショットを返す
         with get_db() as db:
-            trends = analyzer.update_trends(db, text)
+            trends = get_scoring().get_trends_snapshot(db)
 
         return jsonify(
             {
                 "result": analysis_result,
-                "patterns": analyzer.get_patterns(),
+                "patterns": get_analyzer().get_patterns(),
                 "trends": trends,
             }
         )
@@ -116,7 +160,7 @@ def get_popular_trends() -> tuple[Response, int]:
     """
     try:
         with get_db() as db:
-            trends = scoring.get_top_trends(db)
+            trends = get_scoring().get_trends_snapshot(db)["popular"]
             return jsonify({"trends": trends})
     except Exception as e:
         logger.error(f"人気トレンド取得中にエラーが発生: {e}", exc_info=True)
@@ -132,13 +176,121 @@ def get_latest_trends() -> tuple[Response, int]:
     """
     try:
         with get_db() as db:
-            trends = scoring.get_latest_trends(db)
+            trends = get_scoring().get_trends_snapshot(db)["latest"]
             return jsonify({"trends": trends})
     except Exception as e:
         logger.error(f"最新トレンド取得中にエラーが発生: {e}", exc_info=True)
         return jsonify({"error": "内部サーバーエラーが発生しました"}), 500
 
 
+def _analyze_text(text: str) -> List[Dict[str, List[Any]]]:
+    """前処理済みテキストを文ごとに分析する.
+
+    ANALYSIS_CACHE_MAX_TEXT_LENGTH文字以下のテキストの結果は入力テキストを
+    キーにキャッシュされるため、呼び出し側で変更しないこと。長いテキストは
+    キャッシュのメモリ使用量が際限なく増えないよう、毎回分析する。
+
+    Args:
+        text (str): 前処理済みのテキスト
+
+    Returns:
+        List[Dict[str, List[Any]]]: 文ごとの分析結果（列指向）
+    """
+    if len(text) <= ANALYSIS_CACHE_MAX_TEXT_LENGTH:
+        return _analyze_text_cached(text)
+    return _analyze_sentences(text)
+
+
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def _analyze_text_cached(text: str) -> List[Dict[str, List[Any]]]:
+    """分析結果をテキストごとにキャッシュする.
+
+    Args:
+        text (str): 前処理済みのテキスト
+
+    Returns:
+        List[Dict[str, List[Any]]]: 文ごとの分析結果（列指向）
+    """
+    return _analyze_sentences(text)
+
+
+def _analyze_sentences(text: str) -> List[Dict[str, List[Any]]]:
+    """前処理済みテキストを文ごとに分割して分析する.
+
+    Args:
+        text (str): 前処理済みのテキスト
+
+    Returns:
+        List[Dict[str, List[Any]]]: 文ごとの分析結果（列指向）
+    """
+    # 同一テキスト内の重要度判定はキャッシュを共有
+    importance_cache: Dict[str, float] = {}
+    return [
+        _analyze_tokens(tokens, importance_cache)
+        for tokens in map(tokenize_sentence, split_sentences(text))
+    ]
+
+
+def _get_importance(word: str, cache: Dict[str, float]) -> float:
+    """単語の重要度を取得する.
+
+    同じ表層形の単語はリクエスト内で何度も出現するため、
+    判定結果をキャッシュして品詞判定を1回に抑える。
+
+    Args:
+        word (str): 判定対象の単語
+        cache (Dict[str, float]): リクエスト単位の重要度キャッシュ
+
+    Returns:
+        float: 単語の重要度
+    """
+    importance = cache.get(word)
+    if importance is None:
+        importance = get_analyzer()._identify_part_of_speech(word)[1]
+        cache[word] = importance
+    return importance
+
+
+def _analyze_tokens(
+    tokens: List[Token], importance_cache: Dict[str, float]
+) -> Dict[str, List[Any]]:
+    """1文のトークンから列指向の分析結果を生成する.
+
+    トークンごとの辞書ではなく、項目ごとのリストにまとめて返す。
+    i番目のトークンの情報は各リストのi番目の要素に対応する。
+
+    Args:
+        tokens (List[Token]): 分析対象の文のトークン
+        importance_cache (Dict[str, float]): リクエスト単位の重要度キャッシュ
+
+    Returns:
+        Dict[str, List[Any]]: 項目名をキーとした分析結果
+            (word, pos, importance, color, language, is_compound,
+            original_form)
+    """
+    if not tokens:
+        return {field: [] for field in _RESULT_FIELDS}
+
+    # Tokenオブジェクトから必要な情報を列ごとに抽出（転置はC実装で行う）
+    words, pos_list, languages, compounds, original_forms = zip(
+        *map(_TOKEN_FIELDS, tokens)
+    )
+    get_importance = _get_importance
+    return {
+        "word": list(words),
+        "pos": list(pos_list),
+        "importance": [
+            get_importance(word, importance_cache) for word in words
+        ],
+        "color": list(map(_POS_COLOR_GET, pos_list, repeat(GRAY))),
+        "language": list(
+            map(_LANGUAGE_NAME_GET, languages, repeat("UNKNOWN"))
+        ),
+        "is_compound": list(compounds),
+        "original_form": list(original_forms),
+    }
+
+
 def get_pos_color(pos: str) -> str:
     """品詞に応じた色を返す.
 
@@ -148,8 +300,14 @@ def get_pos_color(pos: str) -> str:
     Returns:
         str: 対応する色のコード
     """
-    return POS_COLORS.get(pos, GRAY)  # デフォルトはグレー
+    return _POS_COLOR_GET(pos, GRAY)  # デフォルトはグレー
 
 
 if __name__ == "__main__":
-    app.run(host="localhost", port=8000, debug=True)
+    # ローカル確認用。リローダーとデバッガーは無効にして起動する
+    # 本番環境では `gunicorn -c gunicorn_conf.py wsgi:app` を使用する
+    from werkzeug.serving import run_simple
+
+    run_simple(
+        "localhost", 8000, app, use_reloader=False, use_debugger=False
+    )
@@ -6,8 +6,13 @@
     - ベースディレクトリ設定
     - データベース接続設定
     - フロントエンド関連パス設定
+    - キャッシュ設定
+    - 感情分析のバッチ処理設定
+    - トレンド更新キュー設定
+    - 正規表現エンジン設定
 """
 
+import os
 from pathlib import Path
 from typing import Any, Dict
 
@@ -21,6 +26,20 @@ DB_CONNECT_ARGS: Dict[str, Any] = {
     "timeout": 30,  # 接続タイムアウト(秒)
     "isolation_level": "DEFERRED",  # トランザクション分離レベル
 }
+# コネクションプール設定
+DB_POOL_OPTIONS: Dict[str, Any] = {
+    "pool_size": 20,  # 常時保持する接続数
+    "max_overflow": 10,  # pool_sizeを超えて一時的に許可する接続数
+    "pool_recycle": 1800,  # 接続を再生成するまでの秒数
+}
+# 接続ごとに設定するSQLiteのPRAGMA
+SQLITE_PRAGMAS: Dict[str, Any] = {
+    "journal_mode": "WAL",  # 書き込み中も読み取りをブロックしない
+    "synchronous": "NORMAL",  # WALモードでは安全かつ高速
+    "temp_store": "MEMORY",  # 一時テーブルをメモリに配置
+    "mmap_size": 268_435_456,  # メモリマップI/O(256MB)
+    "cache_size": -65_536,  # ページキャッシュ(64MB、負値はKB指定)
+}
 
 # フロントエンド設定
 TEMPLATE_DIR: Path = BASE_DIR / "frontend" / "templates"
@@ -30,6 +49,22 @@ STATIC_DIR: Path = BASE_DIR / "frontend" / "static"
 SECRET_KEY: str = "your-secret-key-here"  # 本番環境では環境変数から取得すべき
 ALLOWED_HOSTS: list[str] = ["localhost", "127.0.0.1"]
 
+# キャッシュ設定
+ANALYSIS_CACHE_SIZE: int = 256  # 分析結果をキャッシュするテキスト数
+ANALYSIS_CACHE_MAX_TEXT_LENGTH: int = 2048  # キャッシュ対象の最大文字数
+TRENDS_CACHE_TTL: float = 5.0  # トレンド一覧をキャッシュする秒数
+PATTERN_CACHE_SIZE: int = 65_536  # 感情分析・言語判定をキャッシュする語数
+
+# 感情分析のバッチ処理設定
+SENTIMENT_BATCH_CHUNK_SIZE: int = 2048  # ワーカーに一度に渡すテキスト数
+
+# トレンド更新キュー設定
+TREND_QUEUE_BATCH_SIZE: int = 64  # 1回の書き込みでまとめるテキスト数
+TREND_QUEUE_FLUSH_INTERVAL: float = 0.1  # バッチを書き込むまでの待機時間(秒)
+
 # ロギング設定
 LOG_DIR: Path = BASE_DIR / "logs"
 LOG_LEVEL: str = "INFO"
+
+# 正規表現エンジン設定（stdlib / regex、辞書由来の選択パターンに使用）
+REGEX_BACKEND: str = os.environ.get("TRENDAI_REGEX_BACKEND", "stdlib")
@@ -6,6 +6,7 @@
 """
 
 import re
+import sys
 from typing import Dict, List, Pattern
 
 # 文字種パターン
@@ -100,3 +101,11 @@ IMPORTANCE_SCORES: Dict[str, float] = {
     "SCONJ": 0.2,
     "CCONJ": 0.2,
 }
+
+# 品詞名は比較や辞書引きで頻繁に使われるためインターンしておく
+# （英字のキーはコンパイラが自動でインターンするため対象外）
+POS_TYPES = {
+    kind: [sys.intern(pos) for pos in pos_list]
+    for kind, pos_list in POS_TYPES.items()
+}
+POS_TAGS = {tag: sys.intern(pos) for tag, pos in POS_TAGS.items()}
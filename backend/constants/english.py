@@ -1,8 +1,13 @@
 """英語関連の定数定義.
 
 英文解析に必要な様々な英語パターンを正規表現で定義したモジュール。
+パターン文字列は他のパターンへの埋め込み用に残し、動詞の照合用には
+モジュール読み込み時に結合・コンパイル済みのパターン（*_RE）を提供する。
 """
 
+import re
+from typing import Pattern
+
 # 基本動詞パターン
 BE_VERBS = [r"\b(?:is|am|are|was|were|be|been|being)\b"]
 
@@ -144,3 +149,7 @@ QUANTIFIERS = [
     "\\b(?:many|much|few|little|some|any|all|both|each|every|"
     "several|enough|plenty|lots|most|more|less|fewer)\\b"
 ]
+
+# コンパイル済みの動詞パターン（リストは1つの選択パターンに結合）
+BE_VERBS_RE: Pattern = re.compile("|".join(BE_VERBS), re.IGNORECASE)
+COMMON_VERBS_RE: Pattern = re.compile(COMMON_VERBS, re.IGNORECASE)
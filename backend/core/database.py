@@ -4,55 +4,89 @@ SQLAlchemyを使用したデータベース操作の基本機能を提供する
 """
 
 import logging
+import threading
 from contextlib import contextmanager
-from typing import Generator, Optional
+from typing import Any, Generator, Optional
 
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
-
-from backend.config.settings import DB_CONNECT_ARGS, SQLALCHEMY_DATABASE_URL
+from sqlalchemy.pool import QueuePool
+
+from backend.config.settings import (
+    DB_CONNECT_ARGS,
+    DB_POOL_OPTIONS,
+    SQLALCHEMY_DATABASE_URL,
+    SQLITE_PRAGMAS,
+)
 from backend.models.models import Base
 
 logger = logging.getLogger(__name__)
 
 
+def _set_sqlite_pragmas(dbapi_connection: Any, _: Any) -> None:
+    """新規接続にSQLiteのPRAGMAを設定する.
+
+    Args:
+        dbapi_connection (Any): DBAPIの接続オブジェクト
+        _ (Any): コネクションプールのレコード(未使用)
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
 class DatabaseManager:
     """データベース接続とセッション管理を行うクラス."""
 
     _instance: Optional["DatabaseManager"] = None
     _engine: Optional[Engine] = None
+    # 初回呼び出しが複数スレッドから同時に行われても初期化を1回に抑える
+    _lock = threading.Lock()
 
     def __new__(cls) -> "DatabaseManager":
         """インスタンスを生成する."""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
 
     def __init__(self) -> None:
         """データベースエンジンとセッションファクトリを初期化."""
-        if self._engine is None:
-            self._engine = create_engine(
+        if self._engine is not None:
+            return
+        with self._lock:
+            if self._engine is not None:
+                return
+            engine = create_engine(
                 SQLALCHEMY_DATABASE_URL,
                 connect_args=DB_CONNECT_ARGS,
+                poolclass=QueuePool,
                 pool_pre_ping=True,
+                **DB_POOL_OPTIONS,
             )
+            if engine.dialect.name == "sqlite":
+                event.listen(engine, "connect", _set_sqlite_pragmas)
             self.SessionLocal = sessionmaker(
-                autocommit=False, autoflush=False, bind=self._engine
+                autocommit=False, autoflush=False, bind=engine
             )
             # 起動時にテーブルを作成
-            Base.metadata.create_all(bind=self._engine)
+            Base.metadata.create_all(bind=engine)
+            # セッションファクトリの準備が済んでからエンジンを公開する
+            self._engine = engine
             logger.info("Database engine initialized successfully")
 
 
-db_manager = DatabaseManager()
-
-
 @contextmanager
 def get_db() -> Generator[Session, None, None]:
     """データベースセッションを取得する.
 
     コンテキストマネージャとして使用することで、セッションの自動クローズを保証する.
+    データベースエンジンは初回呼び出し時に初期化される.
 
     Yields:
         Session: データベースセッション
@@ -60,7 +94,7 @@ def get_db() -> Generator[Session, None, None]:
     Raises:
         SQLAlchemyError: データベース操作でエラーが発生した場合
     """
-    db = db_manager.SessionLocal()
+    db = DatabaseManager().SessionLocal()
     try:
         yield db
     except SQLAlchemyError as e:
@@ -80,6 +114,7 @@ def init_db() -> None:
         SQLAlchemyError: データベース初期化でエラーが発生した場合
     """
     try:
+        db_manager = DatabaseManager()
         if db_manager._engine is not None:
             Base.metadata.drop_all(bind=db_manager._engine)
             Base.metadata.create_all(bind=db_manager._engine)
@@ -94,6 +129,7 @@ def close_db() -> None:
 
     全てのコネクションプールをクリーンアップし、エンジンを破棄する.
     """
-    if db_manager._engine:
+    db_manager = DatabaseManager._instance
+    if db_manager is not None and db_manager._engine:
         db_manager._engine.dispose()
         logger.info("Database connections closed successfully")
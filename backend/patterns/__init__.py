@@ -5,19 +5,26 @@
 主な機能:
     - 英語/日本語のパターンマッチング (EN_PATTERNS, JP_PATTERNS)
     - ストップワード (EN_STOP_WORDS, JP_STOP_WORDS)
-    - 感情分析 (SENTIMENT_PATTERNS, analyze_sentiment)
+    - 感情分析 (SENTIMENT_PATTERNS, analyze_sentiment,
+      analyze_sentiment_batch)
     - テキスト前処理 (preprocess_text)
     - 文分割 (split_sentences)
     - トークン化 (tokenize_sentence)
+    - キャッシュの破棄 (clear_caches)
 """
 
 from typing import List
 
 from backend.patterns.en_patterns import EN_PATTERNS
 from backend.patterns.jp_patterns import JP_PATTERNS
-from backend.patterns.sentiment import SENTIMENT_PATTERNS, analyze_sentiment
+from backend.patterns.sentiment import (
+    SENTIMENT_PATTERNS,
+    analyze_sentiment,
+    analyze_sentiment_batch,
+)
 from backend.patterns.stop_words import EN_STOP_WORDS, JP_STOP_WORDS
 from backend.patterns.tokenizer import (
+    clear_caches,
     preprocess_text,
     split_sentences,
     tokenize_sentence,
@@ -30,6 +37,8 @@ __all__: List[str] = [
     "JP_STOP_WORDS",
     "SENTIMENT_PATTERNS",
     "analyze_sentiment",
+    "analyze_sentiment_batch",
+    "clear_caches",
     "preprocess_text",
     "split_sentences",
     "tokenize_sentence",
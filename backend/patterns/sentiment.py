@@ -3,9 +3,19 @@
 このモジュールはテキストの感情分析を行うための機能を提供します。
 """
 
+import math
 import re
+from collections import Counter
+from concurrent.futures import Executor
 from dataclasses import dataclass
-from typing import Dict, List
+from functools import lru_cache
+from typing import List, Optional, Pattern, Sequence, Tuple
+
+from backend.config.settings import (
+    PATTERN_CACHE_SIZE,
+    SENTIMENT_BATCH_CHUNK_SIZE,
+)
+from backend.utils.regex_backend import compile_pattern
 
 
 @dataclass
@@ -36,7 +46,27 @@ SENTIMENT_PATTERNS: List[SentimentPattern] = [
     SentimentPattern("不満", 0.7),
 ]
 
+# 辞書の全単語を1つの選択パターンにまとめ、テキストを1回だけ走査する
+# （部分一致する語があっても長い語を優先するよう長さ順に並べる）
+_SENTIMENT_RE: Pattern = compile_pattern(
+    "|".join(
+        re.escape(word)
+        for word in sorted(
+            {pattern.word for pattern in SENTIMENT_PATTERNS},
+            key=len,
+            reverse=True,
+        )
+    )
+)
+
+# スコア計算用の語と、重み付きの対数スコア（log(score) * weight）
+_SENTIMENT_LOG_WEIGHTS: Tuple[Tuple[str, float], ...] = tuple(
+    (pattern.word, math.log(pattern.score) * pattern.weight)
+    for pattern in SENTIMENT_PATTERNS
+)
 
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
 def analyze_sentiment(text: str) -> float:
     """テキストの感情分析を行う.
 
@@ -49,20 +79,46 @@ def analyze_sentiment(text: str) -> float:
     if not text:
         return 1.0
 
-    sentiment_score = 1.0
-    word_counts: Dict[str, int] = {}
-
     # 単語の出現回数をカウント
-    for pattern in SENTIMENT_PATTERNS:
-        count = len(re.findall(pattern.word, text))
-        if count > 0:
-            word_counts[pattern.word] = count
-
-    # スコアの計算
-    for pattern in SENTIMENT_PATTERNS:
-        if pattern.word in word_counts:
-            # 出現回数と重みを考慮したスコア計算
-            count = word_counts[pattern.word]
-            sentiment_score *= pattern.score ** (count * pattern.weight)
+    word_counts = Counter(_SENTIMENT_RE.findall(text))
+    if not word_counts:
+        return 1.0
+
+    # 出現回数と重みを考慮したスコア計算
+    # score ** (count * weight) の積を、対数の和として計算する
+    sentiment_score = math.exp(
+        sum(
+            word_counts[word] * log_weight
+            for word, log_weight in _SENTIMENT_LOG_WEIGHTS
+            if word in word_counts
+        )
+    )
 
     return round(sentiment_score, 3)
+
+
+def analyze_sentiment_batch(
+    texts: Sequence[str],
+    executor: Optional[Executor] = None,
+    chunksize: int = SENTIMENT_BATCH_CHUNK_SIZE,
+) -> List[float]:
+    """複数テキストの感情分析をまとめて行う.
+
+    executorを指定し、テキスト数がchunksizeを超える場合は、
+    chunksize件ずつワーカーに渡して並列に分析する。1件あたりの処理は
+    軽いため、プロセス間通信の回数を抑えるようchunksizeは数千件程度の
+    大きな値にする。
+
+    Args:
+        texts (Sequence[str]): 分析対象のテキスト
+        executor (Optional[Executor]): 並列処理に使うExecutor
+            （Noneの場合は逐次処理）
+        chunksize (int): ワーカーに一度に渡すテキスト数
+
+    Returns:
+        List[float]: テキストごとの感情スコア（入力と同じ順序）
+    """
+    if executor is None or len(texts) <= chunksize:
+        return list(map(analyze_sentiment, texts))
+
+    return list(executor.map(analyze_sentiment, texts, chunksize=chunksize))
@@ -6,10 +6,22 @@
 """
 
 import re
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Dict, List, Optional, Pattern, Set, Tuple
+from functools import lru_cache
+from typing import (
+    Dict,
+    FrozenSet,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+)
 
+from backend.config.settings import PATTERN_CACHE_SIZE
 from backend.constants.english import (
     ARTICLES,
     BE_VERBS,
@@ -37,6 +49,82 @@ from backend.patterns.jp_patterns import (
     SPECIAL,
     SYMBOLS as JP_SYMBOLS,
 )
+from backend.patterns.sentiment import analyze_sentiment
+from backend.utils.regex_backend import compile_pattern
+
+# 文分割・トークン化で毎回使用するパターン（モジュール読み込み時にコンパイル）
+_SENTENCE_END: Pattern = re.compile(
+    r"(?<!\.\.)(?<!Mr)(?<!Mrs)(?<!Dr)(?<!Jr)(?<!Sr)(?<!Ltd)(?<!Inc)"
+    # 略語の除外
+    r"[。！？!?．.]+[\s]*"
+    # 句読点の後に空白を挿入
+    r"(?=(?:[^「」『』（）\(\)]*$|[「」『』（）\(\)][^「」『』（）\(\)]*$))"
+    # 括弧の対応を考慮
+)
+_LIST_ITEM: Pattern = re.compile(
+    r"(?:^|\n)(?:\d+[\.)］】]|\-|\*|\・|\○|\◎|\●)\s*"
+)
+_JAPANESE_CHAR: Pattern = re.compile(JAPANESE_CHARS)
+_BASIC_PARTICLE_CHARS: FrozenSet[str] = frozenset(BASIC_PARTICLES[1:-1])
+_EN_WORD: Pattern = re.compile(r"\b[a-zA-Z]+(?:'[a-zA-Z]+)?\b")
+_NUMBER: Pattern = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BASIC_PARTICLE: Pattern = re.compile(BASIC_PARTICLES)
+
+# 英単語の語尾による判定（グループ名が品詞・時制を表す）
+_EN_POS_SUFFIX: Pattern = re.compile(
+    r"(?:(?P<noun>tion|sion|ness|ment)"
+    r"|(?P<adverb>ly)"
+    r"|(?P<adjective>ful|ous|ive|able|ible)"
+    r"|(?P<verb>ize|ise|ate|ify))\Z"
+)
+_EN_TENSE_SUFFIX: Pattern = re.compile(
+    r"(?:(?P<progressive>ing)|(?P<past>ed)|(?P<present>s))\Z"
+)
+
+# 英語の複合語判定用（小文字化した語を事前に用意しておく）
+_LOWERED_TECH_WORDS: Tuple[Tuple[str, str], ...] = tuple(
+    (word, word.lower()) for word in TECH_WORDS
+)
+_WHITESPACE: Pattern = re.compile(r"\s+")
+_SEGMENT: Pattern = compile_pattern(
+    rf"{JAPANESE_CHARS}"  # 日本語（1文字ずつ）
+    r"|[^\s,.\x80-\U0010FFFF]+"  # 英語（ASCII文字の連続）
+    rf"|(?:(?!{JAPANESE_CHARS})[^\s、，。．\x00-\x7F])+"  # その他
+)
+
+# 括弧の対応（開き括弧: 閉じ括弧）
+_BRACKET_PAIRS: Dict[str, str] = {
+    "「": "」",
+    "『": "』",
+    "(": ")",
+    "（": "）",
+    "[": "]",
+    "［": "］",
+    "{": "}",
+    "｛": "｝",
+    "＜": "＞",
+    "<": ">",
+}
+# 括弧、またはバックスラッシュとそれがエスケープする1文字に一致する
+_BRACKET_SCAN: Pattern = re.compile(
+    r"\\+.?|["
+    + re.escape("".join(_BRACKET_PAIRS) + "".join(_BRACKET_PAIRS.values()))
+    + "]",
+    re.DOTALL,
+)
+_DUPLICATE_PUNCTUATION: Pattern = re.compile(r"([。．.]{2,})|[、，,]{2,}")
+
+# 前処理用の変換表（全角英数字・全角記号の半角化と制御文字の除去）
+_PREPROCESS_TABLE: Dict[int, Optional[int]] = {
+    **str.maketrans(
+        "０１２３４５６７８９ＡＢＣＤＥＦＧＨＩＪＫＬＭＮＯＰＱＲＳＴＵＶＷＸＹＺａｂｃｄｅｆｇｈｉｊｋｌｍｎｏｐｑｒｓｔｕｖｗｘｙｚ",
+        "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz",
+    ),
+    # 全角記号（文字数を一致させる）
+    **str.maketrans("：；？！（）［］｛｝＜＞、，", ":;?!()[]{}<>,,"),
+    # 制御文字
+    **dict.fromkeys([*range(0x00, 0x20), *range(0x7F, 0xA0)]),
+}
 
 
 class Language(Enum):
@@ -47,10 +135,16 @@ class Language(Enum):
     UNKNOWN = auto()  # 言語判定できない場合用
 
 
-@dataclass
+@dataclass(init=False)
 class Token:
     """分割された単語を表すデータクラス.
 
+    トークンは1文につき多数生成されるため、__slots__で
+    インスタンスごとの__dict__を持たないようにしている。dataclassの
+    slots指定はPython 3.10以降のため明示的に宣言し、既定値がクラス変数と
+    衝突しないよう初期化処理は自前で定義する。
+    品詞は色などの辞書引きで繰り返し使われるため、生成時にインターンする。
+
     Attributes:
         text (str): トークンのテキスト
         pos (str): 品詞情報
@@ -60,12 +154,47 @@ class Token:
         features (Dict[str, str]): その他の特徴情報
     """
 
+    __slots__ = (
+        "text",
+        "pos",
+        "language",
+        "is_compound",
+        "original_form",
+        "features",
+    )
+
     text: str
     pos: str
     language: Language
-    is_compound: bool = False
-    original_form: Optional[str] = None
-    features: Dict[str, str] = field(default_factory=dict)
+    is_compound: bool
+    original_form: Optional[str]
+    features: Dict[str, str]
+
+    def __init__(
+        self,
+        text: str,
+        pos: str,
+        language: Language,
+        is_compound: bool = False,
+        original_form: Optional[str] = None,
+        features: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """初期化.
+
+        Args:
+            text (str): トークンのテキスト
+            pos (str): 品詞情報
+            language (Language): 言語種別
+            is_compound (bool): 複合語かどうか
+            original_form (Optional[str]): 原形（活用語の場合）
+            features (Optional[Dict[str, str]]): その他の特徴情報
+        """
+        self.text = text
+        self.pos = sys.intern(pos)
+        self.language = language
+        self.is_compound = is_compound
+        self.original_form = original_form
+        self.features = {} if features is None else features
 
 
 def preprocess_text(text: str) -> str:
@@ -88,31 +217,29 @@ def preprocess_text(text: str) -> str:
         return ""
 
     # 改行と余分な空白の処理
-    text = re.sub(r"\s+", " ", text.strip())
+    text = _WHITESPACE.sub(" ", text.strip())
 
-    # 全角英数字を半角に変換
-    text = text.translate(
-        str.maketrans(
-            "０１２３４５６７８９ＡＢＣＤＥＦＧＨＩＪＫＬＭＮＯＰＱＲＳＴＵＶＷＸＹＺａｂｃｄｅｆｇｈｉｊｋｌｍｎｏｐｑｒｓｔｕｖｗｘｙｚ",
-            "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz",
-        )
-    )
-
-    # 全角記号を半角に変換（文字数を一致させる）
-    text = text.translate(
-        str.maketrans("：；？！（）［］｛｝＜＞、，", ":;?!()[]{}<>,,")
-    )
-
-    # 制御文字を除去
-    text = re.sub(r"[\x00-\x1F\x7F-\x9F]", "", text)
+    # 全角英数字・全角記号を半角に変換し、制御文字を除去
+    text = text.translate(_PREPROCESS_TABLE)
 
     # 重複する句読点を単一に
-    text = re.sub(r"[。．.]{2,}", "。", text)
-    text = re.sub(r"[、，,]{2,}", "、", text)
+    text = _DUPLICATE_PUNCTUATION.sub(_replace_duplicate_punctuation, text)
 
     return text.strip()
 
 
+def _replace_duplicate_punctuation(match: Match) -> str:
+    """連続する句読点を1文字に置き換える.
+
+    Args:
+        match (Match): 連続する句点または読点の一致
+
+    Returns:
+        str: 句点の連続なら「。」、読点の連続なら「、」
+    """
+    return "。" if match.group(1) else "、"
+
+
 def split_sentences(text: str) -> List[str]:
     """テキストを文単位に分割する.
 
@@ -127,89 +254,89 @@ def split_sentences(text: str) -> List[str]:
         - 箇条書きや番号付きリストに対応
         - 省略記号(...)を考慮
     """
-    # より正確な文分割パターン
-    pattern = (
-        r"(?<!\.\.)(?<!Mr)(?<!Mrs)(?<!Dr)(?<!Jr)(?<!Sr)(?<!Ltd)(?<!Inc)"
-        # 略語の除外
-        r"[。！？!?．.]+[\s]*"
-        # 句読点の後に空白を挿入
-        r"(?=(?:[^「」『』（）\(\)]*$|[「」『』（）\(\)][^「」『』（）\(\)]*$))"
-        # 括弧の対応を考慮
-    )
-
-    # 箇条書きや番号付きリストを考慮した分割
-    list_pattern = r"(?:^|\n)(?:\d+[\.)］】]|\-|\*|\・|\○|\◎|\●)\s*"
-
-    # 文の分割
-    raw_sentences = re.split(pattern, text)
+    # 文の分割（略語・括弧の対応を考慮）
+    raw_sentences = _SENTENCE_END.split(text)
     sentences = []
-    current = ""
+
+    # 括弧が閉じるまでの断片はリストにためておき、対応の確認は
+    # 追加した断片だけを走査して行う
+    fragments: List[str] = []
+    brackets = _BracketTracker()
 
     for s in raw_sentences:
         # リスト項目の処理
-        list_items = re.split(list_pattern, s)
+        # 箇条書きや番号付きリストを考慮した分割
+        list_items = _LIST_ITEM.split(s)
         if len(list_items) > 1:
-            for item in list_items:
-                if item.strip():
-                    current += item
-                    if _is_balanced(current):
-                        sentences.append(current.strip())
-                        current = ""
+            parts = [item for item in list_items if item.strip()]
         else:
-            current += s
-            if _is_balanced(current):
-                sentences.append(current.strip())
-                current = ""
+            parts = [s]
 
+        for part in parts:
+            fragments.append(part)
+            if brackets.feed(part):
+                sentences.append("".join(fragments).strip())
+                fragments.clear()
+                brackets.reset()
+
+    current = "".join(fragments)
     if current:
         sentences.append(current.strip())
 
     return [s for s in sentences if s]
 
 
-def _is_balanced(text: str) -> bool:
-    """括弧や引用符が正しく対応しているか確認する.
+class _BracketTracker:
+    """追加される文の断片について、括弧や引用符の対応を追跡する.
 
-    Args:
-        text (str): チェック対象のテキスト
-
-    Returns:
-        bool: 括弧や引用符が正しく対応している場合True
+    連結した文字列全体を毎回走査し直さず、追加された断片だけを走査して
+    状態を引き継ぐ。
     """
-    pairs = {
-        "「": "」",
-        "『": "』",
-        "(": ")",
-        "（": "）",
-        "[": "]",
-        "［": "］",
-        "{": "}",
-        "｛": "｝",
-        "＜": "＞",
-        "<": ">",
-    }
-    stack = []
-    escaped = False
-
-    for i, char in enumerate(text):
-        if char == "\\":
-            escaped = True
-            continue
-
-        if escaped:
-            escaped = False
-            continue
-
-        if char in pairs:
-            stack.append((char, i))
-        elif char in pairs.values():
-            if not stack:
-                return False
-            last_char, _ = stack.pop()
-            if pairs[last_char] != char:
+
+    __slots__ = ("_stack", "_broken", "_escaping")
+
+    def __init__(self) -> None:
+        """空の状態で初期化する."""
+        self._stack: List[str] = []
+        self._broken = False
+        self._escaping = False
+
+    def reset(self) -> None:
+        """状態を初期化する."""
+        self._stack.clear()
+        self._broken = False
+        self._escaping = False
+
+    def feed(self, fragment: str) -> bool:
+        """断片を追加し、これまでの連結結果の対応を返す.
+
+        Args:
+            fragment (str): 追加する断片
+
+        Returns:
+            bool: 連結結果の括弧や引用符が正しく対応している場合True
+        """
+        # 対応の誤りは後から追加しても解消されない
+        if self._broken:
+            return False
+
+        # 前の断片の末尾がバックスラッシュなら、先頭の文字はエスケープされる
+        if self._escaping:
+            fragment = "\\" + fragment
+
+        for char in _BRACKET_SCAN.findall(fragment):
+            if char[0] == "\\":
+                # バックスラッシュだけの一致は断片の末尾に限られる
+                self._escaping = char[-1] == "\\"
+                continue
+
+            if char in _BRACKET_PAIRS:
+                self._stack.append(char)
+            elif not self._stack or _BRACKET_PAIRS[self._stack.pop()] != char:
+                self._broken = True
                 return False
 
-    return len(stack) == 0
+        return not self._stack
 
 
 def tokenize_sentence(sentence: str) -> List[Token]:
@@ -221,49 +348,9 @@ def tokenize_sentence(sentence: str) -> List[Token]:
     Returns:
         List[Token]: 分割された単語のリスト（品詞情報付き）
     """
-    tokens: List[Token] = []
-    current_word = ""
-    current_type = None  # 現在の文字種類（日本語/英語/その他）
-
-    for char in sentence:
-        # カンマやピリオドの処理
-        if char in ["、", "，", ",", "。", "．", "."]:
-            if current_word:
-                tokens.append(_create_token(current_word))
-                current_word = ""
-            current_type = None
-            continue
-
-        # 空白の処理
-        if char.isspace():
-            if current_word:
-                tokens.append(_create_token(current_word))
-                current_word = ""
-            current_type = None
-            continue
-
-        # 文字種の判定
-        if re.match(JAPANESE_CHARS, char):
-            char_type = "jp"
-        elif char.isascii():
-            char_type = "en"
-        else:
-            char_type = "other"
-
-        # 文字種が変わった場合、または日本語の場合は文字ごとに分割
-        if current_type != char_type or char_type == "jp":
-            if current_word:
-                tokens.append(_create_token(current_word))
-                current_word = ""
-            current_type = char_type
-
-        current_word += char
-
-    # 残りの文字の処理
-    if current_word:
-        tokens.append(_create_token(current_word))
-
-    return tokens
+    # 区切り文字と空白を除き、日本語は1文字ずつ、英語とその他の文字は
+    # 同じ文字種が続く範囲を1単語として切り出す
+    return [_create_token(word) for word in _SEGMENT.findall(sentence)]
 
 
 def _create_token(text: str) -> Token:
@@ -276,12 +363,13 @@ def _create_token(text: str) -> Token:
         Token: 生成されたトークン
     """
     # 言語判定
-    if re.search(JAPANESE_CHARS, text):
+    if _JAPANESE_CHAR.search(text):
         lang = Language.JAPANESE
         # 日本語の品詞判定
-        if re.match(r"[はがをのにへとでもや]", text):
+        # 先頭1文字の判定は正規表現を使わず文字の比較で行う
+        if text[0] in _BASIC_PARTICLE_CHARS:
             pos = "助詞"
-        elif re.match(r"[あ-ん]+", text):
+        elif "あ" <= text[0] <= "ん":
             pos = "動詞"  # 簡易的な判定
         else:
             pos = "名詞"  # デフォルト
@@ -308,6 +396,7 @@ def _create_token(text: str) -> Token:
     )
 
 
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
 def _detect_language(text: str) -> Language:
     """テキストの言語を判定する.
 
@@ -317,11 +406,33 @@ def _detect_language(text: str) -> Language:
     Returns:
         Language: 判定された言語
     """
-    # 日本語文字の検出
-    jp_ratio = len(re.findall(JAPANESE_CHARS, text)) / len(text) if text else 0
+    if not text:
+        return Language.UNKNOWN
+
+    # ASCII文字だけなら日本語文字を含まず、英字はisalphaで数えられる
+    if text.isascii():
+        en_count = sum(map(str.isalpha, text))
+        return (
+            Language.ENGLISH
+            if en_count / len(text) > 0.3
+            else Language.UNKNOWN
+        )
 
-    # 英語文字の検出
-    en_ratio = len(re.findall(r"[a-zA-Z]", text)) / len(text) if text else 0
+    # 日本語文字と英字を1回の走査で数える（範囲はJAPANESE_CHARSと同じ）
+    jp_count = 0
+    en_count = 0
+    for char in text:
+        if (
+            "ぁ" <= char <= "ん"
+            or "ァ" <= char <= "ン"
+            or "一" <= char <= "龯"
+        ):
+            jp_count += 1
+        elif "a" <= char <= "z" or "A" <= char <= "Z":
+            en_count += 1
+
+    jp_ratio = jp_count / len(text)
+    en_ratio = en_count / len(text)
 
     if jp_ratio > 0.3:
         return Language.JAPANESE
@@ -344,17 +455,18 @@ def _check_compound_word(
         Optional[Tuple[Token, int]]: 複合語トークンと長さのペア
     """
     if lang == Language.JAPANESE:
-        compounds = [w for w in COMPOUND_WORDS if w not in seen_compounds]
-        for compound in compounds:
-            if text.startswith(compound):
+        for compound in COMPOUND_WORDS:
+            if compound not in seen_compounds and text.startswith(compound):
                 seen_compounds.add(compound)
                 return Token(
                     compound, "複合語", Language.JAPANESE, is_compound=True
                 ), len(compound)
     else:
-        compounds = [w for w in TECH_WORDS if w not in seen_compounds]
-        for compound in compounds:
-            if text.lower().startswith(compound.lower()):
+        lowered_text = text.lower()
+        for compound, lowered in _LOWERED_TECH_WORDS:
+            if compound not in seen_compounds and lowered_text.startswith(
+                lowered
+            ):
                 seen_compounds.add(compound)
                 return Token(
                     compound, "compound", Language.ENGLISH, is_compound=True
@@ -432,11 +544,8 @@ def _build_en_patterns() -> List[Tuple[Pattern, str]]:
     patterns.extend(
         [(re.compile(rf"\b{p}\b", re.IGNORECASE), "verb") for p in BE_VERBS]
     )
-    patterns.extend(
-        [
-            (re.compile(rf"\b{p}\b", re.IGNORECASE), "verb")
-            for p in COMMON_VERBS
-        ]
+    patterns.append(
+        (re.compile(rf"\b{COMMON_VERBS}\b", re.IGNORECASE), "verb")
     )
 
     # 機能語
@@ -535,19 +644,19 @@ def _handle_unknown_token(text: str) -> Token:
         Token: 生成されたトークン
     """
     # 英単語として認識を試みる
-    en_word_match = re.match(r"\b[a-zA-Z]+(?:'[a-zA-Z]+)?\b", text)
+    en_word_match = _EN_WORD.match(text)
     if en_word_match:
         word = en_word_match.group(0)
         pos = _guess_en_pos(word)
         return Token(word, pos, Language.ENGLISH)
 
     # 数値として認識を試みる
-    number_match = re.match(r"\b\d+(?:\.\d+)?\b", text)
+    number_match = _NUMBER.match(text)
     if number_match:
         return Token(number_match.group(0), "number", Language.UNKNOWN)
 
     # 助詞として認識を試みる
-    particle_match = re.match(BASIC_PARTICLES, text)
+    particle_match = _BASIC_PARTICLE.match(text)
     if particle_match:
         return Token(particle_match.group(0), "助詞", Language.JAPANESE)
 
@@ -598,12 +707,9 @@ def _extract_en_features(word: str, pos: str) -> Dict[str, str]:
 
     if pos == "verb":
         # 時制の推定
-        if word.endswith("ing"):
-            features["tense"] = "progressive"
-        elif word.endswith("ed"):
-            features["tense"] = "past"
-        elif word.endswith("s"):
-            features["tense"] = "present"
+        tense_match = _EN_TENSE_SUFFIX.search(word)
+        if tense_match:
+            features["tense"] = tense_match.lastgroup
 
     elif pos == "noun":
         # 複数形の検出
@@ -615,6 +721,7 @@ def _extract_en_features(word: str, pos: str) -> Dict[str, str]:
     return features
 
 
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
 def _guess_en_pos(word: str) -> str:
     """英単語の品詞を推測する.
 
@@ -624,15 +731,19 @@ def _guess_en_pos(word: str) -> str:
     Returns:
         str: 推測された品詞
     """
-    if word.endswith(("tion", "sion", "ness", "ment")):
-        return "noun"
-    if word.endswith("ly"):
-        return "adverb"
-    if word.endswith(("ful", "ous", "ive", "able", "ible")):
-        return "adjective"
-    if word.endswith(("ize", "ise", "ate", "ify")):
-        return "verb"
-    return "unknown"
+    # 語尾の候補は互いに重ならないため、一致したグループがそのまま品詞になる
+    suffix_match = _EN_POS_SUFFIX.search(word)
+    return suffix_match.lastgroup if suffix_match else "unknown"
+
+
+def clear_caches() -> None:
+    """言語判定・品詞推測・感情分析のキャッシュを破棄する.
+
+    メモリ使用量を抑えたい場合や、辞書を差し替えた後に使用する。
+    """
+    _detect_language.cache_clear()
+    _guess_en_pos.cache_clear()
+    analyze_sentiment.cache_clear()
 
 
 def _estimate_base_form(word: str, lang: Language) -> str:
@@ -651,12 +762,12 @@ def _estimate_base_form(word: str, lang: Language) -> str:
             if word.endswith(ending):
                 return word[: -len(ending)] + base
     else:
-        # 英語の活用語の原形推定
+        # 英語の活用語の原形推定（語尾を取り除く）
         if word.endswith("ing"):
-            return re.sub(r"ing$", "", word)
+            return word[:-3]
         if word.endswith("ed"):
-            return re.sub(r"ed$", "", word)
+            return word[:-2]
         if word.endswith("s"):
-            return re.sub(r"s$", "", word)
+            return word[:-1]
 
     return word
@@ -6,6 +6,7 @@
     - TrendAnalyzer: トレンドの分析を行うクラス
     - ScoringCalculator: スコアの計算を行うクラス
     - TrendScoring: トレンドスコアリングの実装クラス
+    - TrendUpdateQueue: トレンド更新をバッチ処理するキュー
 
 使用例:
     from backend.services.trend import TrendAnalyzer
@@ -16,5 +17,11 @@
 
 from backend.services.trend.analyzer import TrendAnalyzer
 from backend.services.trend.scoring import ScoringCalculator, TrendScoring
+from backend.services.trend.updater import TrendUpdateQueue
 
-__all__ = ["TrendAnalyzer", "ScoringCalculator", "TrendScoring"]
+__all__ = [
+    "TrendAnalyzer",
+    "ScoringCalculator",
+    "TrendScoring",
+    "TrendUpdateQueue",
+]
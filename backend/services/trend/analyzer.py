@@ -10,16 +10,22 @@
 """
 
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Pattern, Tuple
 
+from sqlalchemy.dialects.sqlite import insert
+
+from backend.config.settings import PATTERN_CACHE_SIZE
 from backend.constants.colors import BLACK, GRAY, POS_COLORS
-from backend.constants.english import BE_VERBS, COMMON_VERBS
+from backend.constants.english import BE_VERBS_RE, COMMON_VERBS_RE
 from backend.constants.japanese import JAPANESE_CHARS
 from backend.constants.particles import IMPORTANT_PARTICLES
 from backend.constants.patterns import (
     SENTENCE_SEPARATORS,
     TRAILING_SYMBOLS,
 )
+from backend.models.models import Trend
 from backend.patterns.en_patterns import (
     FUNCTION_WORDS,
     INDEPENDENT_WORDS,
@@ -29,6 +35,111 @@ from backend.patterns.jp_patterns import (
     INDEPENDENT_WORDS as JP_INDEPENDENT_WORDS,
 )
 from backend.patterns.stop_words import EN_STOP_WORDS, JP_STOP_WORDS
+from backend.utils.regex_backend import compile_pattern, trie_alternation
+
+# キーワードの出現回数を加算するUPSERT文
+_INSERT_TREND = insert(Trend)
+_UPSERT_TREND_COUNTS = _INSERT_TREND.on_conflict_do_update(
+    index_elements=[Trend.keyword],
+    set_={"count": Trend.count + _INSERT_TREND.excluded.count},
+)
+
+# 前後の文がない場合の文脈
+_NO_WORDS: FrozenSet[str] = frozenset()
+
+# 品詞ごとにまとめた正規表現の一覧（品詞, パターン）
+PosPatterns = List[Tuple[str, Pattern]]
+
+# 日本語の文字
+_JAPANESE_CHAR: Pattern = re.compile(JAPANESE_CHARS)
+
+# 単語の区切り（日本語は1文字ずつ、それ以外は空白・日本語までの連続部分）
+_WORD_SPLITTER: Pattern = re.compile(
+    rf"{JAPANESE_CHARS}|(?:(?!{JAPANESE_CHARS})\S)+"
+)
+
+# 語の列挙だけからなるパターン（例: \b(?:です|ます)\b）の形式
+_WORD_ALTERNATION: Pattern = re.compile(
+    r"((?:\\b)*)\(\?:([^\\\[\](){}|.*+?^$\s]+(?:\|[^\\\[\](){}|.*+?^$\s]+)*)\)"
+    r"((?:\\b)*)"
+)
+
+
+def _compile_pos_patterns(
+    patterns: Dict[str, List[Any]], flags: int = 0
+) -> PosPatterns:
+    """品詞ごとのパターン群を1つの選択パターンにまとめてコンパイルする.
+
+    入れ子のリストは平坦化し、コンパイル済みのパターンはそのフラグを
+    インラインフラグとして引き継ぐ。語の列挙は接頭辞木にまとめる
+    （一致の有無だけを使うため、選択肢の順序は結果に影響しない）。
+    コンパイルには設定された正規表現エンジンを使う。
+
+    Args:
+        patterns (Dict[str, List[Any]]): 品詞をキーとするパターンの辞書
+        flags (int): コンパイル時のフラグ
+
+    Returns:
+        PosPatterns: 品詞とコンパイル済みパターンの組の一覧
+    """
+    compiled: PosPatterns = []
+    for pos, items in patterns.items():
+        sources = []
+        stack = list(reversed(items))
+        while stack:
+            item = stack.pop()
+            if isinstance(item, list):
+                stack.extend(reversed(item))
+            elif isinstance(item, re.Pattern):
+                inline = "i" if item.flags & re.IGNORECASE else ""
+                sources.append(f"(?{inline}:{item.pattern})")
+            elif alternation := _WORD_ALTERNATION.fullmatch(item):
+                # 語の列挙は共通の接頭辞をまとめ、照合の手戻りを減らす
+                lead, words, trail = alternation.groups()
+                trie = trie_alternation(words.split("|"))
+                sources.append(f"(?:{lead}{trie}{trail})")
+            else:
+                sources.append(f"(?:{item})")
+        if sources:
+            compiled.append((pos, compile_pattern("|".join(sources), flags)))
+    return compiled
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _contains_japanese(text: str) -> bool:
+    """テキストに日本語の文字が含まれるかを判定する.
+
+    Args:
+        text (str): 判定対象のテキスト
+
+    Returns:
+        bool: 日本語の文字を含む場合True
+    """
+    # ASCIIだけの英単語は文字範囲を調べるまでもなく日本語を含まない
+    return not text.isascii() and bool(_JAPANESE_CHAR.search(text))
+
+
+def _literal_words(patterns: Dict[str, List[Any]]) -> List[str]:
+    """パターンの辞書から、正規表現を使わずに照合できる語を取り出す.
+
+    メタ文字を含まないパターンと、語の列挙だけからなるパターンが対象。
+
+    Args:
+        patterns (Dict[str, List[Any]]): 品詞をキーとするパターンの辞書
+
+    Returns:
+        List[str]: 語の一覧
+    """
+    words: List[str] = []
+    for items in patterns.values():
+        for item in items:
+            if not isinstance(item, str):
+                continue
+            if re.escape(item) == item:
+                words.append(item)
+            elif alternation := _WORD_ALTERNATION.fullmatch(item):
+                words.extend(alternation.group(2).split("|"))
+    return words
 
 
 class TrendAnalyzer:
@@ -39,11 +150,35 @@ class TrendAnalyzer:
         self.jp_stop_words: Dict[str, Any] = JP_STOP_WORDS
         self.en_stop_words: Dict[str, Any] = EN_STOP_WORDS
         # コンパイル済みの正規表現パターンを保持
-        self.japanese_chars = re.compile(JAPANESE_CHARS)
-        self.sentence_separators = re.compile(SENTENCE_SEPARATORS)
-        self.trailing_symbols = re.compile(TRAILING_SYMBOLS)
-        self.be_verbs = re.compile(BE_VERBS[0], re.I)
-        self.common_verbs = re.compile(COMMON_VERBS, re.I)
+        self.japanese_chars = _JAPANESE_CHAR
+        self._word_splitter = _WORD_SPLITTER
+        self.sentence_separators = SENTENCE_SEPARATORS
+        self.trailing_symbols = TRAILING_SYMBOLS
+        self.be_verbs = BE_VERBS_RE
+        self.common_verbs = COMMON_VERBS_RE
+        # 品詞ごとのパターンは1つの選択にまとめ、1回のmatchで判定する
+        self._jp_dependent = _compile_pos_patterns(DEPENDENT_WORDS)
+        self._jp_independent = _compile_pos_patterns(JP_INDEPENDENT_WORDS)
+        self._en_function = _compile_pos_patterns(FUNCTION_WORDS, re.I)
+        self._en_independent = _compile_pos_patterns(INDEPENDENT_WORDS, re.I)
+        # 辞書に列挙された語は判定結果を事前に求めておき、辞書引きで返す
+        self._literal_pos: Dict[str, Tuple[str, float]] = {}
+        self._literal_pos = {
+            word: self._classify_part_of_speech(word)
+            for patterns in (
+                DEPENDENT_WORDS,
+                JP_INDEPENDENT_WORDS,
+                FUNCTION_WORDS,
+                INDEPENDENT_WORDS,
+            )
+            for word in _literal_words(patterns)
+        }
+        # 応答に含めるパターン情報（変化しないため1回だけ作成する）
+        self._patterns = self._build_patterns()
+        # 同じ語は文書内・文書間で繰り返し現れるため、判定結果を保持する
+        self._pos_cache = lru_cache(maxsize=PATTERN_CACHE_SIZE)(
+            self._classify_part_of_speech
+        )
 
     def _is_japanese_text(self, text: str) -> bool:
         """テキストが日本語かどうかを判定する.
@@ -54,10 +189,17 @@ class TrendAnalyzer:
         Returns:
             bool: 日本語の場合True
         """
-        return bool(self.japanese_chars.search(text))
+        return _contains_japanese(text)
 
     def _identify_part_of_speech(self, word: str) -> Tuple[str, float]:
+        """単語の品詞と重要度を判定する（判定結果はキャッシュされる）."""
+        return self._pos_cache(word)
+
+    def _classify_part_of_speech(self, word: str) -> Tuple[str, float]:
         """単語の品詞と重要度を判定する."""
+        hit = self._literal_pos.get(word)
+        if hit is not None:
+            return hit
         return (
             self._identify_japanese_pos(word)
             if self._is_japanese_text(word)
@@ -67,29 +209,17 @@ class TrendAnalyzer:
     def _identify_japanese_pos(self, word: str) -> Tuple[str, float]:
         """日本語の品詞と重要度を判定する."""
         # 助詞・助動詞（付属語）
-        for pos, patterns in DEPENDENT_WORDS.items():
-            for pattern in patterns:
-                if re.match(pattern, word):
-                    return pos, 0.5
+        for pos, pattern in self._jp_dependent:
+            if pattern.match(word):
+                return pos, 0.5
 
         # 自立語（名詞、動詞、形容詞、副詞）
-        for pos, patterns in JP_INDEPENDENT_WORDS.items():
-            for pattern in patterns:
-                if re.match(pattern, word):
-                    return pos, 2.0
+        for pos, pattern in self._jp_independent:
+            if pattern.match(word):
+                return pos, 2.0
 
         return "記号", 0.1
 
-    def _match_patterns(self, word: str, patterns: List[Any]) -> bool:
-        """パターンとのマッチングをチェックする."""
-        for pattern in patterns:
-            if isinstance(pattern, list):
-                if any(re.match(p, word, re.I) for p in pattern):
-                    return True
-            elif re.match(pattern, word, re.I):
-                return True
-        return False
-
     def _identify_english_pos(self, word: str) -> Tuple[str, float]:
         """英語の品詞と重要度を判定する."""
         # 基本動詞
@@ -97,13 +227,13 @@ class TrendAnalyzer:
             return "verb", 2.0
 
         # 機能語（前置詞、冠詞、代名詞）
-        for pos, patterns in FUNCTION_WORDS.items():
-            if self._match_patterns(word, patterns):
+        for pos, pattern in self._en_function:
+            if pattern.match(word):
                 return pos, 0.5
 
         # 自立語（動詞、形容詞、副詞、名詞）
-        for pos, patterns in INDEPENDENT_WORDS.items():
-            if self._match_patterns(word, patterns):
+        for pos, pattern in self._en_independent:
+            if pattern.match(word):
                 return pos, 2.0
 
         return "symbol", 0.1
@@ -111,25 +241,32 @@ class TrendAnalyzer:
     def analyze(self, text: str) -> List[Dict[str, Any]]:
         """テキストを分析し、品詞情報を付与して返す."""
         # 文単位で分割
-        sentences = self.sentence_separators.split(text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        # 区切りの前後の空白は1回のstripで除き、空の文を除外する
+        sentences = [
+            stripped
+            for s in self.sentence_separators.split(text)
+            if (stripped := s.strip())
+        ]
+
+        # 各文の単語は1回だけ抽出し、前後の文の文脈としても使い回す
+        sentence_words = [self._extract_words(s) for s in sentences]
+        # 文脈の照合用に、各文の単語の集合も1回だけ作成する
+        word_sets = [frozenset(words) for words in sentence_words]
 
         all_results = []
-        for i, sentence in enumerate(sentences):
+        for i, words in enumerate(sentence_words):
             # 前後の文脈を取得
-            prev_sentence = sentences[i - 1] if i > 0 else None
-            next_sentence = (
-                sentences[i + 1] if i < len(sentences) - 1 else None
+            prev_words = word_sets[i - 1] if i > 0 else _NO_WORDS
+            next_words = (
+                word_sets[i + 1] if i < len(word_sets) - 1 else _NO_WORDS
             )
 
             # 文脈を考慮した分析
-            results = self._analyze_with_context(
-                sentence, prev_sentence, next_sentence
-            )
+            results = self._analyze_with_context(words, prev_words, next_words)
             all_results.extend(results)
 
             # 文の区切りを追加
-            if i < len(sentences) - 1:
+            if i < len(sentence_words) - 1:
                 all_results.append(
                     {
                         "word": "。",
@@ -142,187 +279,195 @@ class TrendAnalyzer:
         return all_results
 
     def update_trends(self, db: Any, text: str) -> List[Dict[str, Any]]:
-        """トレンドを更新する."""
-        from sqlalchemy import select
-        from sqlalchemy.sql.expression import text as sql_text
+        """トレンドを更新する.
+
+        キーワードの出現回数を集計し、1つのUPSERT文と1回のコミットで
+        反映する。
+
+        Args:
+            db (Any): データベースセッション
+            text (str): 分析対象のテキスト
+
+        Returns:
+            List[Dict[str, Any]]: 更新後のトレンド（キーワードごとに1件、
+                出現順）
+        """
+        counts = Counter(self._extract_keywords(text))
+        if not counts:
+            return []
+
+        stmt = _UPSERT_TREND_COUNTS.returning(
+            Trend.id, Trend.keyword, Trend.count, sort_by_parameter_order=True
+        )
+        rows = db.execute(
+            stmt,
+            [
+                {"keyword": keyword, "count": count}
+                for keyword, count in counts.items()
+            ],
+        ).all()
+        db.commit()
+
+        return [
+            {"id": row.id, "keyword": row.keyword, "count": row.count}
+            for row in rows
+        ]
+
+    def update_trends_batch(
+        self, db: Any, keyword_batches: Iterable[Iterable[str]]
+    ) -> None:
+        """複数テキスト分のトレンドをまとめて更新する.
+
+        キーワードの出現回数を集計し、1つのUPSERT文と1回のコミットで
+        反映する。
 
-        from backend.models.models import Trend
+        Args:
+            db (Any): データベースセッション
+            keyword_batches (Iterable[Iterable[str]]):
+                テキストごとのキーワード（select_keywordsの結果）
+        """
+        counts = Counter(
+            keyword for keywords in keyword_batches for keyword in keywords
+        )
+        if not counts:
+            return
+
+        db.execute(
+            _UPSERT_TREND_COUNTS,
+            [
+                {"keyword": keyword, "count": count}
+                for keyword, count in counts.items()
+            ],
+        )
+        db.commit()
+
+    def select_keywords(
+        self, scored_words: Iterable[Tuple[str, float]]
+    ) -> List[str]:
+        """重要度付きの単語からトレンド対象のキーワードを選ぶ.
 
-        trends = []
-        words = self._extract_words(text)
+        分析済みの単語と重要度を渡すことで、品詞判定をやり直さずに
+        トレンド更新用のキーワードを得られる。
 
-        for word in words:
-            pos, importance = self._identify_part_of_speech(word)
+        Args:
+            scored_words (Iterable[Tuple[str, float]]): 単語と重要度のペア
 
+        Returns:
+            List[str]: 出現順のキーワード（重複を含む）
+        """
+        keywords = []
+        for word, importance in scored_words:
             # 重要度が低い単語はスキップ
             if importance <= 0.5:
                 continue
 
             # 記号を除去
             word = self.trailing_symbols.sub("", word)
-            if not word:
-                continue
+            if word:
+                keywords.append(word)
 
-            # トレンドを更新
-            stmt = select(Trend.id, Trend.keyword, Trend.count).where(
-                Trend.keyword == word
-            )
-            result = db.execute(stmt).fetchone()
-
-            if result:
-                trend_id = result[0]
-                count = result[2] + 1
-                db.execute(
-                    sql_text(
-                        "UPDATE trends SET count = :count WHERE id = :id"
-                    ),
-                    {"count": count, "id": trend_id},
-                )
-            else:
-                result = db.execute(
-                    sql_text(
-                        "INSERT INTO trends (keyword, count, created_at) "
-                        "VALUES (:keyword, :count, CURRENT_TIMESTAMP) "
-                        "RETURNING id, keyword, count"
-                    ),
-                    {"keyword": word, "count": 1},
-                )
-                result = result.fetchone()
+        return keywords
 
-            if result:
-                trends.append(
-                    {"id": result[0], "keyword": result[1], "count": result[2]}
-                )
+    def _extract_keywords(self, text: str) -> List[str]:
+        """テキストからトレンド対象のキーワードを抽出する.
 
-            db.commit()
+        Args:
+            text (str): 抽出対象のテキスト
 
-        return trends
+        Returns:
+            List[str]: 出現順のキーワード（重複を含む）
+        """
+        return self.select_keywords(
+            (word, self._identify_part_of_speech(word)[1])
+            for word in self._extract_words(text)
+        )
 
     def _analyze_with_context(
         self,
-        sentence: str,
-        prev_sentence: Optional[str] = None,
-        next_sentence: Optional[str] = None,
+        words: List[str],
+        prev_words: FrozenSet[str],
+        next_words: FrozenSet[str],
     ) -> List[Dict[str, Any]]:
-        """文脈を考慮してテキストを分析する."""
-        results = []
-        words = self._extract_words(sentence)
+        """文脈を考慮してテキストを分析する.
 
-        # 前後の文脈の単語を取得
-        prev_words = (
-            self._extract_words(prev_sentence) if prev_sentence else []
-        )
-        next_words = (
-            self._extract_words(next_sentence) if next_sentence else []
-        )
+        Args:
+            words (List[str]): 分析対象の文の単語
+            prev_words (FrozenSet[str]): 前の文の単語の集合
+            next_words (FrozenSet[str]): 次の文の単語の集合
 
-        for i, word in enumerate(words):
-            # 基本の品詞と重要度を取得
-            pos, importance = self._identify_part_of_speech(word)
-
-            # 文脈に基づいて重要度を調整
-            importance = self._adjust_importance(
-                word,
-                pos,
-                importance,
-                words,
-                i,  # 現在の文の情報
-                prev_words,
-                next_words,  # 前後の文の情報
-            )
+        Returns:
+            List[Dict[str, Any]]: 単語ごとの分析結果
+        """
+        # 基本の品詞と重要度は単語ごとに1回だけ判定する
+        pos_info = [self._identify_part_of_speech(word) for word in words]
 
-            color = self._get_color_for_pos(pos, importance)
-            results.append(
-                {
-                    "word": word,
-                    "pos": pos,
-                    "importance": importance,
-                    "color": color,
-                }
-            )
+        # 文脈に基づいて重要度を調整
+        importances = self._adjust_importances(
+            words, pos_info, prev_words, next_words
+        )
 
-        return results
+        return [
+            {
+                "word": word,
+                "pos": pos,
+                "importance": importance,
+                "color": self._get_color_for_pos(pos, importance),
+            }
+            for word, (pos, _), importance in zip(
+                words, pos_info, importances
+            )
+        ]
 
     def _extract_words(self, text: str) -> List[str]:
-        """テキストから単語を抽出する."""
-        if not text:
-            return []
-
-        words = []
-        current_word = ""
+        """テキストから単語を抽出する.
 
-        for char in text:
-            if char.isspace():
-                if current_word:
-                    words.append(current_word)
-                    current_word = ""
-                continue
-
-            # 日本語の場合
-            if self._is_japanese_text(char):
-                if current_word:
-                    words.append(current_word)
-                current_word = char
-            # 英語の場合
-            else:
-                if self._is_japanese_text(current_word):
-                    if current_word:
-                        words.append(current_word)
-                    current_word = char
-                else:
-                    current_word += char
+        日本語は1文字ずつ、それ以外は空白と日本語で区切った連続部分を
+        1単語とする。
+        """
+        return self._word_splitter.findall(text) if text else []
 
-        if current_word:
-            words.append(current_word)
+    def _adjust_importances(
+        self,
+        words: List[str],
+        pos_info: List[Tuple[str, float]],
+        prev_words: FrozenSet[str],
+        next_words: FrozenSet[str],
+    ) -> List[float]:
+        """文中の全単語の重要度を文脈に基づいてまとめて調整する.
 
-        return words
+        位置・前後の文脈・文法の順に、調整の種類ごとに文全体を処理する。
 
-    def _adjust_importance(
-        self,
-        word: str,
-        pos: str,
-        base_importance: float,
-        current_words: List[str],
-        current_index: int,
-        prev_words: List[str],
-        next_words: List[str],
-    ) -> float:
-        """文脈に基づいて重要度を調整する."""
-        importance = base_importance
-        importance = self._adjust_by_position(
-            importance, current_index, len(current_words)
-        )
-        importance = self._adjust_by_context(
-            importance, word, prev_words, next_words
-        )
-        importance = self._adjust_by_grammar(
-            importance, word, pos, current_words, current_index
-        )
-        return min(importance, 3.0)
+        Args:
+            words (List[str]): 文の単語
+            pos_info (List[Tuple[str, float]]): 単語ごとの品詞と重要度
+            prev_words (FrozenSet[str]): 前の文の単語の集合
+            next_words (FrozenSet[str]): 次の文の単語の集合
 
-    def _adjust_by_position(
-        self, importance: float, index: int, length: int
-    ) -> float:
-        """位置に基づく重要度の調整."""
-        return (
-            importance * 1.2
-            if index == 0 or index == length - 1
-            else importance
-        )
+        Returns:
+            List[float]: 調整後の重要度（上限3.0）
+        """
+        importances = [importance for _, importance in pos_info]
+        if not importances:
+            return importances
+
+        # 位置に基づく調整（文頭・文末）
+        importances[0] *= 1.2
+        if len(importances) > 1:
+            importances[-1] *= 1.2
+
+        # 前後の文脈に基づく調整
+        if prev_words or next_words:
+            for i, word in enumerate(words):
+                if word in prev_words or word in next_words:
+                    importances[i] *= 1.5
+
+        # 文法的な特徴に基づく調整
+        for i, word in enumerate(words):
+            importances[i] = self._adjust_by_grammar(
+                importances[i], word, pos_info[i][0], words, i, pos_info
+            )
 
-    def _adjust_by_context(
-        self,
-        importance: float,
-        word: str,
-        prev_words: List[str],
-        next_words: List[str],
-    ) -> float:
-        """前後の文脈に基づいて重要度を調整する."""
-        return (
-            importance * 1.5
-            if word in prev_words or word in next_words
-            else importance
-        )
+        return [min(importance, 3.0) for importance in importances]
 
     def _adjust_by_grammar(
         self,
@@ -331,6 +476,7 @@ class TrendAnalyzer:
         pos: str,
         words: List[str],
         index: int,
+        pos_info: List[Tuple[str, float]],
     ) -> float:
         """文法的な特徴に基づく重要度の調整."""
         if self._is_japanese_text(word):
@@ -346,15 +492,13 @@ class TrendAnalyzer:
             if (
                 pos == "noun"
                 and index > 0
-                and self._identify_part_of_speech(words[index - 1])[0]
-                in ["article", "adjective"]
+                and pos_info[index - 1][0] in ["article", "adjective"]
             ):
                 importance *= 1.3
             elif (
                 pos == "verb"
                 and index > 0
-                and self._identify_part_of_speech(words[index - 1])[0]
-                in ["noun", "pronoun"]
+                and pos_info[index - 1][0] in ["noun", "pronoun"]
             ):
                 importance *= 1.2
         return importance
@@ -367,7 +511,18 @@ class TrendAnalyzer:
         return POS_COLORS.get(pos, BLACK)  # デフォルトは黒
 
     def get_patterns(self) -> Dict[str, Dict[str, Any]]:
-        """パターン情報を取得する."""
+        """パターン情報を取得する.
+
+        パターンは変化しないため、初期化時に作成した辞書を返す。
+        呼び出し側で変更しないこと。
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 言語ごとの品詞パターン
+        """
+        return self._patterns
+
+    def _build_patterns(self) -> Dict[str, Dict[str, Any]]:
+        """パターン情報を文字列化して作成する."""
 
         def convert_patterns(patterns: Dict[str, Any]) -> Dict[str, Any]:
             result = {}
@@ -1,7 +1,112 @@
 """スコア計算モジュール."""
 
 import re
-from typing import Dict, Pattern, Set
+from itertools import chain
+from typing import Any, Dict, FrozenSet, List, Optional, Pattern, Set, Tuple
+
+from backend.utils.regex_backend import compile_pattern
+
+# 緊急性を示す語
+_URGENT_TERMS: Tuple[str, ...] = ("速報", "breaking", "urgent")
+
+# 感嘆符・疑問符
+_EXCLAMATIONS: FrozenSet[str] = frozenset("!?！？")
+
+
+def _compile_union(patterns: List[Any]) -> Pattern:
+    """パターンの一覧を1つの選択パターンにまとめてコンパイルする.
+
+    入れ子のリストは平坦化し、コンパイル済みのパターンはその文字列を使う。
+    コンパイルには設定された正規表現エンジンを使う。
+
+    Args:
+        patterns (List[Any]): パターン文字列・コンパイル済みパターンの一覧
+
+    Returns:
+        Pattern: 大文字小文字を区別しない選択パターン
+    """
+    sources = []
+    stack = list(reversed(patterns))
+    while stack:
+        pattern = stack.pop()
+        if isinstance(pattern, list):
+            stack.extend(reversed(pattern))
+        else:
+            source = getattr(pattern, "pattern", pattern)
+            sources.append(f"(?:{source})")
+    return compile_pattern("|".join(sources), re.I)
+
+
+def _compile_indicator_scan(trend_indicators: Set[str]) -> Optional[Pattern]:
+    """トレンド指標の語をまとめた選択パターンを作成する.
+
+    いずれかの指標（またはその構成語）を含むキーワードだけに一致する。
+
+    Args:
+        trend_indicators (Set[str]): トレンド指標のキーワードセット
+
+    Returns:
+        Optional[Pattern]: 選択パターン（空白だけの指標を含む場合はNone）
+    """
+    parts = [indicator.split() for indicator in trend_indicators]
+    if not parts or not all(parts):
+        return None
+    words = sorted({word for words in parts for word in words}, key=len)
+    return re.compile("|".join(re.escape(word) for word in reversed(words)))
+
+
+def _calculate_time_weight(hours_old: float) -> float:
+    """時間重みを計算.
+
+    Args:
+        hours_old (float): 経過時間（時間単位）
+
+    Returns:
+        float: 計算された時間重み
+    """
+    if hours_old <= 0.5:
+        return 1.5  # 30分以内
+    if hours_old <= 1:
+        return 1.2  # 1時間以内
+    if hours_old <= 3:
+        return 1.0  # 3時間以内
+    if hours_old <= 6:
+        return 0.9  # 6時間以内
+    if hours_old <= 12:
+        return 0.7  # 12時間以内
+    if hours_old <= 24:
+        return 0.5  # 24時間以内
+    return 0.3  # 24時間超過
+
+
+def _finalize_score(
+    count: int,
+    time_weight: float,
+    importance_weight: float,
+    trend_bonus: float,
+) -> float:
+    """各要素から最終スコアを計算する.
+
+    Args:
+        count (int): キーワードの出現回数
+        time_weight (float): 時間重み
+        importance_weight (float): キーワードの重要度の重み
+        trend_bonus (float): トレンドボーナス
+
+    Returns:
+        float: 最終スコア（上限10000、小数点2桁で丸められる）
+    """
+    # 基本スコア（出現回数に基づく対数的なスケーリング）
+    base_score = count * 10 * (1 + 0.1 * len(str(count)))
+
+    # 最終スコアの計算（正規化付き）
+    raw_score = (
+        base_score * time_weight * importance_weight * (1 + trend_bonus)
+    )
+    # スコアの上限設定（min()の呼び出しを避けて比較で切り詰める）
+    if raw_score > 10000:
+        raw_score = 10000
+    return round(raw_score, 2)
 
 
 class ScoringCalculator:
@@ -11,7 +116,11 @@ class ScoringCalculator:
     """
 
     def __init__(
-        self, importance_weights: Dict[str, float], trend_indicators: Set[str]
+        self,
+        importance_weights: Dict[str, float],
+        trend_indicators: Set[str],
+        jp_patterns: Dict[str, list],
+        en_patterns: Dict[str, list],
     ):
         """初期化.
 
@@ -20,18 +129,34 @@ class ScoringCalculator:
                 キーワードパターンごとの重要度の重み
             trend_indicators (Set[str]):
                 トレンド指標のキーワードセット
+            jp_patterns (Dict[str, list]): 日本語のパターン辞書
+            en_patterns (Dict[str, list]): 英語のパターン辞書
         """
         self.importance_weights = importance_weights
         self.trend_indicators = trend_indicators
-        self._compile_regex_cache: Dict[str, Pattern] = {}
+
+        # どの指標にも一致しないキーワードは、指標ごとの走査を省く
+        self._indicator_scan = _compile_indicator_scan(trend_indicators)
+
+        # 重みを持つ品詞ごとにパターンを1つにまとめ、重みの大きい順に並べる
+        # （重みのない品詞は重要度に影響しないため対象外）
+        self._weighted_unions: List[Tuple[float, Pattern]] = sorted(
+            (
+                (importance_weights[pattern_type], _compile_union(patterns))
+                for pattern_type, patterns in chain(
+                    jp_patterns.items(), en_patterns.items()
+                )
+                if pattern_type in importance_weights and patterns
+            ),
+            key=lambda item: item[0],
+            reverse=True,
+        )
 
     def calculate_popularity_score(
         self,
         count: int,
         hours_old: float,
         keyword: str,
-        jp_patterns: Dict[str, list],
-        en_patterns: Dict[str, list],
     ) -> float:
         """人気スコアを計算する.
 
@@ -40,8 +165,6 @@ class ScoringCalculator:
             hours_old (float): キーワードが最初に出現してからの経過時間
                 （時間単位）
             keyword (str): 評価対象のキーワード
-            jp_patterns (Dict[str, list]): 日本語のパターン辞書
-            en_patterns (Dict[str, list]): 英語のパターン辞書
 
         Returns:
             float: 計算された最終スコア（小数点2桁で丸められる）
@@ -49,86 +172,59 @@ class ScoringCalculator:
         if not keyword or hours_old < 0:
             return 0.0
 
-        # 基本スコア（出現回数に基づく対数的なスケーリング）
-        base_score = count * 10 * (1 + 0.1 * len(str(count)))
-
         # 時間減衰（より細かい時間帯で重み付け）
-        time_weight = self._calculate_time_weight(hours_old)
+        time_weight = _calculate_time_weight(hours_old)
 
         # キーワードの重要度を計算（キャッシュ付き）
-        importance_weight = self._calculate_keyword_importance(
-            keyword, jp_patterns, en_patterns
-        )
+        importance_weight = self._calculate_keyword_importance(keyword)
 
         # トレンド性の評価（拡張版）
         trend_bonus = self._evaluate_trend_indicators(keyword)
 
-        # 最終スコアの計算（正規化付き）
-        raw_score = (
-            base_score * time_weight * importance_weight * (1 + trend_bonus)
+        return _finalize_score(
+            count, time_weight, importance_weight, trend_bonus
         )
-        normalized_score = min(raw_score, 10000)  # スコアの上限設定
-
-        return round(normalized_score, 2)
 
-    def _calculate_time_weight(self, hours_old: float) -> float:
-        """時間重みを計算.
-
-        Args:
-            hours_old (float): 経過時間（時間単位）
-
-        Returns:
-            float: 計算された時間重み
-        """
-        if hours_old <= 0.5:
-            return 1.5  # 30分以内
-        if hours_old <= 1:
-            return 1.2  # 1時間以内
-        if hours_old <= 3:
-            return 1.0  # 3時間以内
-        if hours_old <= 6:
-            return 0.9  # 6時間以内
-        if hours_old <= 12:
-            return 0.7  # 12時間以内
-        if hours_old <= 24:
-            return 0.5  # 24時間以内
-        return 0.3  # 24時間超過
-
-    def _calculate_keyword_importance(
-        self,
-        keyword: str,
-        jp_patterns: Dict[str, list],
-        en_patterns: Dict[str, list],
-    ) -> float:
+    def _calculate_keyword_importance(self, keyword: str) -> float:
         """キーワードの重要度を計算.
 
         Args:
             keyword (str): 評価対象のキーワード
-            jp_patterns (Dict[str, list]): 日本語のパターン辞書
-            en_patterns (Dict[str, list]): 英語のパターン辞書
 
         Returns:
             float: 計算された重要度の重み
         """
-        max_weight = 1.0
         keyword = keyword.lower()
 
-        def check_patterns(patterns_dict: Dict[str, list]) -> None:
-            nonlocal max_weight
-            for pattern_type, patterns in patterns_dict.items():
-                for pattern in patterns:
-                    if pattern not in self._compile_regex_cache:
-                        self._compile_regex_cache[pattern] = re.compile(
-                            pattern, re.I
-                        )
-                    if self._compile_regex_cache[pattern].search(keyword):
-                        weight = self.importance_weights[pattern_type]
-                        max_weight = max(max_weight, weight)
+        # 重みの大きい順に調べるため、最初に一致した品詞の重みが最大となる
+        for weight, union in self._weighted_unions:
+            if weight <= 1.0:
+                break
+            if union.search(keyword):
+                return weight
+
+        return 1.0
 
-        check_patterns(jp_patterns)
-        check_patterns(en_patterns)
+    def _match_trend_indicators(self, keyword_lower: str) -> float:
+        """トレンド指標との一致によるボーナスを計算.
 
-        return max_weight
+        Args:
+            keyword_lower (str): 小文字化したキーワード
+
+        Returns:
+            float: 指標との一致によるボーナス
+        """
+        scan = self._indicator_scan
+        if scan is not None and not scan.search(keyword_lower):
+            return 0.0
+
+        bonus = 0.0
+        for indicator in self.trend_indicators:
+            if indicator in keyword_lower:
+                bonus += 0.2
+            elif any(part in keyword_lower for part in indicator.split()):
+                bonus += 0.1
+        return bonus
 
     def _evaluate_trend_indicators(self, keyword: str) -> float:
         """トレンド性を評価.
@@ -139,28 +235,23 @@ class ScoringCalculator:
         Returns:
             float: 計算されたトレンドボーナス（0.0-1.0の範囲）
         """
-        bonus = 0.0
         keyword_lower = keyword.lower()
 
         # トレンド指標との一致をチェック（部分一致も考慮）
-        for indicator in self.trend_indicators:
-            if indicator in keyword_lower:
-                bonus += 0.2
-            elif any(part in keyword_lower for part in indicator.split()):
-                bonus += 0.1
+        bonus = self._match_trend_indicators(keyword_lower)
 
         # 特殊な形式のボーナス（拡張）
         if "#" in keyword:
             bonus += 0.3
         if "@" in keyword:  # メンション
             bonus += 0.2
-        if re.search(r"\d+", keyword):  # 数字を含む
+        if any(char.isdecimal() for char in keyword):  # 数字を含む
             bonus += 0.1
         if len(keyword) <= 10:  # 短いキーワード
             bonus += 0.1
-        if re.search(r"[!?！？]+", keyword):  # 感嘆符や疑問符
+        if not _EXCLAMATIONS.isdisjoint(keyword):  # 感嘆符や疑問符
             bonus += 0.15
-        if re.search(r"(速報|breaking|urgent)", keyword_lower):  # 緊急性
+        if any(term in keyword_lower for term in _URGENT_TERMS):  # 緊急性
             bonus += 0.25
 
         return min(bonus, 1.0)  # 最大1.0までの制限
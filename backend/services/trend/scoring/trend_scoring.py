@@ -3,17 +3,29 @@
 トレンドの重要度とスコアを計算し、人気順・最新順でトレンドを取得する機能を提供する。
 """
 
+import math
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy import literal, select, union_all
+from sqlalchemy.orm import Session, aliased
 
+from backend.config.settings import TRENDS_CACHE_TTL
 from backend.models import Trend
 from backend.patterns.en_patterns import EN_PATTERNS
 from backend.patterns.jp_patterns import JP_PATTERNS
 from backend.services.trend.scoring.calculator import ScoringCalculator
 
+# トレンド一覧の候補の種類
+_RECENT, _IMPORTANT, _POPULAR = range(3)
+
+
+def _score_of(trend: Trend) -> float:
+    """並べ替え用のスコアを返す（SQLの降順と同様にNULLは最後に並べる）."""
+    return trend.score if trend.score is not None else -math.inf
+
 
 class TrendScoring:
     """トレンドのスコアリングを管理するクラス.
@@ -27,6 +39,7 @@ class TrendScoring:
         importance_weights: 各要素の重要度の重み付け
         trend_indicators: トレンド性を評価するためのキーワード
         calculator: スコア計算を行うCalculatorインスタンス
+        snapshot_ttl: トレンド一覧のキャッシュ有効期間（秒）
     """
 
     def __init__(self):
@@ -68,9 +81,20 @@ class TrendScoring:
 
         # スコア計算機の初期化
         self.calculator = ScoringCalculator(
-            self.importance_weights, self.trend_indicators
+            self.importance_weights,
+            self.trend_indicators,
+            self.jp_patterns,
+            self.en_patterns,
         )
 
+        # トレンド一覧のキャッシュ（件数ごとに取得時刻と結果を保持）
+        self.snapshot_ttl = TRENDS_CACHE_TTL
+        self._snapshot_cache: Dict[
+            int,
+            Tuple[float, Dict[str, List[Dict[str, Union[str, int, float]]]]],
+        ] = {}
+        self._snapshot_lock = threading.Lock()
+
     def calculate_popularity_score(
         self, count: int, hours_old: float, keyword: str
     ) -> float:
@@ -85,7 +109,7 @@ class TrendScoring:
             float: 計算された人気スコア
         """
         return self.calculator.calculate_popularity_score(
-            count, hours_old, keyword, self.jp_patterns, self.en_patterns
+            count, hours_old, keyword
         )
 
     def get_top_trends(
@@ -117,7 +141,7 @@ class TrendScoring:
             ).all()
         )
 
-        return self._format_trends(db, trends)
+        return self._format_trends(trends)
 
     def get_latest_trends(
         self, db: Session, limit: int = 10
@@ -134,79 +158,201 @@ class TrendScoring:
         Returns:
             List[Dict[str, Union[str, int, float]]]: トレンド情報のリスト
         """
+        candidates = self._fetch_candidates(db, limit, popular=False)
+        return self._format_trends(self._select_latest(candidates, limit))
+
+    def get_trends_snapshot(
+        self, db: Session, limit: int = 10
+    ) -> Dict[str, List[Dict[str, Union[str, int, float]]]]:
+        """人気順・最新順のトレンドをまとめて取得する.
+
+        人気順・最新順の候補をSQLで件数を絞って1回のクエリで取得し、
+        振り分けはPython側で行う。結果は ``snapshot_ttl`` 秒間キャッシュする。
+
+        Args:
+            db (Session): データベースセッション
+            limit (int, optional): それぞれ取得する件数. デフォルトは10
+
+        Returns:
+            Dict[str, List[Dict[str, Union[str, int, float]]]]:
+                "popular"と"latest"をキーとしたトレンド情報のリスト
+        """
+        now = time.monotonic()
+        with self._snapshot_lock:
+            cached = self._snapshot_cache.get(limit)
+            if cached is not None and now - cached[0] < self.snapshot_ttl:
+                return cached[1]
+
+        snapshot = self._build_trends_snapshot(db, limit)
+        with self._snapshot_lock:
+            self._snapshot_cache[limit] = (now, snapshot)
+        return snapshot
+
+    def _build_trends_snapshot(
+        self, db: Session, limit: int
+    ) -> Dict[str, List[Dict[str, Union[str, int, float]]]]:
+        """人気順・最新順のトレンドを1回のクエリから構築する.
+
+        並び順と絞り込み条件は get_top_trends / get_latest_trends と同じ。
+
+        Args:
+            db (Session): データベースセッション
+            limit (int): それぞれ取得する件数
+
+        Returns:
+            Dict[str, List[Dict[str, Union[str, int, float]]]]:
+                "popular"と"latest"をキーとしたトレンド情報のリスト
+        """
+        candidates = self._fetch_candidates(db, limit, popular=True)
+
+        # 人気順: スコア・出現回数・作成日時の降順
+        popular = sorted(
+            candidates[_POPULAR],
+            key=lambda t: (_score_of(t), t.count, t.created_at, t.id),
+            reverse=True,
+        )
+
+        return {
+            "popular": self._format_trends(popular),
+            "latest": self._format_trends(
+                self._select_latest(candidates, limit)
+            ),
+        }
+
+    def _fetch_candidates(
+        self, db: Session, limit: int, popular: bool
+    ) -> Dict[int, List[Trend]]:
+        """人気順・最新順の候補となるトレンドを1回のクエリで取得する.
+
+        直近6時間の新しい順、24時間以内の重要なトレンドのスコア順、
+        (popularがTrueの場合は)24時間以内の人気順の上位をそれぞれSQLの
+        LIMITで絞り、UNION ALLでまとめて取得する。
+
+        Args:
+            db (Session): データベースセッション
+            limit (int): 取得する件数
+            popular (bool): 人気順の候補も含めるかどうか
+
+        Returns:
+            Dict[int, List[Trend]]: 候補の種類ごとのトレンドリスト
+        """
         now = datetime.now()
         cutoff_time = now - timedelta(hours=24)
-
-        # 直近6時間のトレンドを優先
         recent_cutoff = now - timedelta(hours=6)
-        recent_trends = db.scalars(
-            select(Trend)
+
+        queries = {
+            # 同順位の並びはいずれもIDの降順（作成日時のインデックスの
+            # 走査順）に固定する
+            _RECENT: select(Trend)
             .where(Trend.created_at >= recent_cutoff)
-            .order_by(Trend.created_at.desc())
-            .limit(limit // 2)
-        ).all()
-
-        # 残りは24時間以内の重要なトレンド
-        remaining_limit = limit - len(recent_trends)
-        if remaining_limit > 0:
-            remaining_trends = db.scalars(
+            .order_by(Trend.created_at.desc(), Trend.id.desc())
+            .limit(limit // 2),
+            # 直近の件数が足りない分を補うため、最大でlimit件まで取得する
+            _IMPORTANT: select(Trend)
+            .where(
+                Trend.created_at >= cutoff_time,
+                Trend.created_at < recent_cutoff,
+                Trend.count > 100,  # 重要なものだけ
+                Trend.score > 0.5,  # スコアによるフィルタリング
+            )
+            .order_by(
+                Trend.score.desc(), Trend.created_at.desc(), Trend.id.desc()
+            )
+            .limit(limit),
+        }
+        if popular:
+            queries[_POPULAR] = (
                 select(Trend)
-                .where(
-                    Trend.created_at >= cutoff_time,
-                    Trend.created_at < recent_cutoff,
-                    Trend.count > 100,  # 重要なものだけ
-                    Trend.score > 0.5,  # スコアによるフィルタリングを追加
+                .where(Trend.created_at >= cutoff_time)
+                .order_by(
+                    Trend.score.desc(),
+                    Trend.count.desc(),
+                    Trend.created_at.desc(),
+                    Trend.id.desc(),
                 )
-                .order_by(Trend.score.desc(), Trend.created_at.desc())
-                .limit(remaining_limit)
-            ).all()
-        else:
-            remaining_trends = []
+                .limit(limit)
+            )
+
+        # SQLiteではLIMIT付きのSELECTを直接UNIONできないため、副問い合わせ
+        # として包み、どの候補かを示す列を付ける
+        union = union_all(
+            *(
+                select(query.subquery(), literal(kind).label("kind"))
+                for kind, query in queries.items()
+            )
+        ).subquery()
+        trend = aliased(Trend, union)
+
+        candidates: Dict[int, List[Trend]] = {kind: [] for kind in queries}
+        for row, kind in db.execute(select(trend, union.c.kind)):
+            candidates[kind].append(row)
+        return candidates
+
+    def _select_latest(
+        self, candidates: Dict[int, List[Trend]], limit: int
+    ) -> List[Trend]:
+        """候補のトレンドから最新順の一覧を選ぶ.
+
+        直近のトレンドを優先し、残りは重要なトレンドから補完する。
 
-        all_trends = list(recent_trends) + list(remaining_trends)
-        return self._format_trends(db, all_trends)
+        Args:
+            candidates (Dict[int, List[Trend]]): 候補の種類ごとのトレンド
+            limit (int): 取得する件数
+
+        Returns:
+            List[Trend]: 最新順のトレンドリスト
+        """
+        recent = sorted(
+            candidates[_RECENT],
+            key=lambda t: (t.created_at, t.id),
+            reverse=True,
+        )
+        remaining_limit = limit - len(recent)
+        remaining = (
+            sorted(
+                candidates[_IMPORTANT],
+                key=lambda t: (_score_of(t), t.created_at, t.id),
+                reverse=True,
+            )[:remaining_limit]
+            if remaining_limit > 0
+            else []
+        )
+        return recent + remaining
 
     def _format_trends(
-        self, db: Session, trends: List[Trend]
+        self, trends: List[Trend]
     ) -> List[Dict[str, Union[str, int, float]]]:
         """トレンドデータをフォーマット.
 
         Args:
-            db (Session): データベースセッション
             trends (List[Trend]): フォーマット対象のトレンドリスト
 
         Returns:
             List[Dict[str, Union[str, int, float]]]: フォーマット済みトレンド
         """
+        now = datetime.now()
         return [
             {
                 "keyword": str(trend.keyword),
-                "count": int(
-                    db.scalar(select(func.coalesce(trend.count, 0))) or 0
-                ),
-                "score": round(
-                    float(
-                        db.scalar(select(func.coalesce(trend.score, 0.0)))
-                        or 0.0
-                    ),
-                    2,
-                ),
+                "count": int(trend.count or 0),
+                "score": round(float(trend.score or 0.0), 2),
                 "created_at": trend.created_at.isoformat(),
-                "trend_type": self._determine_trend_type(trend),
+                "trend_type": self._determine_trend_type(trend, now),
             }
             for trend in trends
         ]
 
-    def _determine_trend_type(self, trend: Trend) -> str:
+    def _determine_trend_type(self, trend: Trend, now: datetime) -> str:
         """トレンドの種類を判定する.
 
         Args:
             trend (Trend): 判定対象のトレンド
+            now (datetime): 経過時間の基準となる現在時刻
 
         Returns:
             str: トレンドの種類（"hot", "rising", "new"のいずれか）
         """
-        hours_old = (datetime.now() - trend.created_at).total_seconds() / 3600
+        hours_old = (now - trend.created_at).total_seconds() / 3600
 
         if (
             trend.score is not None
@@ -0,0 +1,144 @@
+"""トレンド更新キュー.
+
+トレンドの更新をリクエスト処理から切り離し、バックグラウンドの
+ワーカースレッドでまとめてデータベースに書き込む。
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import List, Optional
+
+from backend.config.settings import (
+    TREND_QUEUE_BATCH_SIZE,
+    TREND_QUEUE_FLUSH_INTERVAL,
+)
+from backend.core.database import get_db
+from backend.services.trend.analyzer import TrendAnalyzer
+
+logger = logging.getLogger(__name__)
+
+
+class TrendUpdateQueue:
+    """トレンド更新を非同期にバッチ処理するキュー.
+
+    テキストごとのキーワードを最大 ``batch_size`` 件、または
+    ``flush_interval`` 秒ごとにまとめ、1トランザクションで反映する。
+    ワーカースレッドは最初の投入時に起動する。
+
+    Attributes:
+        analyzer: トレンドの更新を行うTrendAnalyzerインスタンス
+        batch_size: 1回の書き込みでまとめるテキストの最大数
+        flush_interval: バッチを書き込むまでの最大待機時間（秒）
+    """
+
+    def __init__(
+        self,
+        analyzer: TrendAnalyzer,
+        batch_size: int = TREND_QUEUE_BATCH_SIZE,
+        flush_interval: float = TREND_QUEUE_FLUSH_INTERVAL,
+    ) -> None:
+        """初期化.
+
+        Args:
+            analyzer (TrendAnalyzer): トレンドの更新を行うインスタンス
+            batch_size (int): 1回の書き込みでまとめるテキストの最大数
+            flush_interval (float): バッチを書き込むまでの最大待機時間（秒）
+        """
+        self.analyzer = analyzer
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue[Optional[List[str]]] = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        # 終了時に残りの更新を反映する（スレッドの再起動ごとに登録しない）
+        atexit.register(self.stop)
+
+    def put(self, keywords: List[str]) -> None:
+        """1テキスト分のトレンド対象キーワードをキューに追加する.
+
+        Args:
+            keywords (List[str]): TrendAnalyzer.select_keywordsの結果
+        """
+        self._start()
+        self._queue.put_nowait(keywords)
+
+    def join(self) -> None:
+        """キュー内の更新がすべて反映されるまで待機する."""
+        self._queue.join()
+
+    def stop(self) -> None:
+        """残りの更新を反映してワーカースレッドを停止する."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                return
+            self._queue.put_nowait(None)
+            self._thread.join()
+            self._thread = None
+
+    def _start(self) -> None:
+        """ワーカースレッドが未起動であれば起動する."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="trend-updater", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        """キューからキーワードを取り出し、バッチ単位で書き込む."""
+        while True:
+            keywords = self._queue.get()
+            if keywords is None:
+                self._queue.task_done()
+                return
+
+            batch = [keywords]
+            stopping = self._collect_batch(batch)
+            self._flush(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+            if stopping:
+                self._queue.task_done()
+                return
+
+    def _collect_batch(self, batch: List[List[str]]) -> bool:
+        """待機時間内に届いたキーワードをバッチに追加する.
+
+        Args:
+            batch (List[List[str]]): 追加先のバッチ
+
+        Returns:
+            bool: 停止要求を受け取った場合True
+        """
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                keywords = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if keywords is None:
+                return True
+            batch.append(keywords)
+        return False
+
+    def _flush(self, batch: List[List[str]]) -> None:
+        """バッチをデータベースに反映する.
+
+        Args:
+            batch (List[List[str]]): 反映するテキストごとのキーワード
+        """
+        try:
+            with get_db() as db:
+                self.analyzer.update_trends_batch(db, batch)
+        except Exception as e:
+            logger.error(f"トレンド更新中にエラーが発生: {e}", exc_info=True)
@@ -4,6 +4,9 @@
 
 主な機能:
     - setup_logger: アプリケーションのロギング設定を行う関数
+    - OrjsonProvider: orjsonを使用したFlask用のJSONプロバイダー
+    - compile_pattern: 設定された正規表現エンジンでパターンをコンパイルする関数
+    - trie_alternation: 語の一覧から接頭辞をまとめた選択パターンを作る関数
 
 使用例:
     from backend.utils import setup_logger
@@ -12,6 +15,13 @@
     logger.info("アプリケーションを開始します")
 """
 
+from backend.utils.json_provider import OrjsonProvider
 from backend.utils.logger import setup_logger
+from backend.utils.regex_backend import compile_pattern, trie_alternation
 
-__all__ = ["setup_logger"]
+__all__ = [
+    "OrjsonProvider",
+    "compile_pattern",
+    "setup_logger",
+    "trie_alternation",
+]
@@ -0,0 +1,73 @@
+"""JSONシリアライズ設定.
+
+このモジュールはorjsonを使用したFlask用のJSONプロバイダーを提供します。
+"""
+
+from typing import Any, Union
+
+import orjson
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """orjsonでJSONのエンコード・デコードを行うプロバイダー.
+
+    標準のjsonモジュールより高速にシリアライズし、レスポンスには
+    エンコード済みのバイト列をそのまま使用する。
+    """
+
+    # 標準のプロバイダーと同じく、文字列以外の辞書キーも文字列に変換する
+    option: int = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """オブジェクトをJSON文字列に変換する.
+
+        Args:
+            obj (Any): シリアライズ対象のオブジェクト
+            **kwargs (Any): 互換性のための引数(未使用)
+
+        Returns:
+            str: JSON文字列
+        """
+        return orjson.dumps(
+            obj, default=self.default, option=self.option
+        ).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """JSON文字列をオブジェクトに変換する.
+
+        Args:
+            s (Union[str, bytes]): JSON文字列
+            **kwargs (Any): 互換性のための引数(未使用)
+
+        Returns:
+            Any: デシリアライズされたオブジェクト
+        """
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """JSONレスポンスを生成する.
+
+        文字列への変換を挟まず、orjsonのバイト列をそのまま返す。
+
+        Args:
+            *args (Any): シリアライズする値
+            **kwargs (Any): 辞書としてシリアライズするキーワード引数
+
+        Returns:
+            Response: JSONレスポンス
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self.option
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+
+        return self._app.response_class(
+            orjson.dumps(
+                obj,
+                default=self.default,
+                option=option | orjson.OPT_APPEND_NEWLINE,
+            ),
+            mimetype=self.mimetype,
+        )
@@ -18,6 +18,8 @@ def setup_logger(
 ) -> logging.Logger:
     """ロガーを設定し、構成されたロガーインスタンスを返します.
 
+    繰り返し呼び出しても、同じ出力先のハンドラは1度だけ追加されます。
+
     Args:
         log_level (int): ロギングレベル. デフォルトはINFO
         log_file (Optional[str]): ログファイルのパス. Noneの場合は標準出力のみ
@@ -29,6 +31,8 @@ def setup_logger(
     """
     logger = logging.getLogger(__name__)
     logger.setLevel(log_level)
+    # ルートロガーへの伝播による二重出力を防ぐ
+    logger.propagate = False
 
     # フォーマッタの設定
     formatter = logging.Formatter(
@@ -36,13 +40,20 @@ def setup_logger(
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
-    # 標準出力へのハンドラを追加
-    stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(formatter)
-    logger.addHandler(stream_handler)
+    # 標準出力へのハンドラを追加（未追加の場合のみ）
+    if not any(
+        type(handler) is logging.StreamHandler for handler in logger.handlers
+    ):
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        logger.addHandler(stream_handler)
 
-    # ファイルへのログ出力が指定された場合
-    if log_file:
+    # ファイルへのログ出力が指定された場合（同じファイルは1度だけ追加）
+    if log_file and not any(
+        isinstance(handler, logging.handlers.RotatingFileHandler)
+        and handler.baseFilename == os.path.abspath(log_file)
+        for handler in logger.handlers
+    ):
         log_dir = Path(log_file).parent
         os.makedirs(log_dir, exist_ok=True)
 
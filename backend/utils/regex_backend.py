@@ -0,0 +1,107 @@
+"""正規表現エンジンの選択.
+
+このモジュールは、辞書から生成する大きな選択パターンをコンパイルする
+正規表現エンジンを、設定（環境変数 TRENDAI_REGEX_BACKEND）に応じて
+切り替える機能を提供します。
+
+対応するエンジン:
+    - stdlib: 標準ライブラリのre（デフォルト）
+    - regex: サードパーティのregexモジュール（reと互換のV0モード）
+
+Note:
+    google-re2は単語境界がASCII限定で後読みにも対応しないため、
+    日本語を含むパターンの結果が変わることから対象外としている。
+    指定したエンジンがインストールされていない場合はreを使用する。
+
+また、語の列挙を接頭辞木にまとめた選択パターンを作成する機能も
+提供します。
+"""
+
+import importlib
+import logging
+import re
+from types import ModuleType
+from typing import Any, Dict, Iterable, Pattern
+
+from backend.config.settings import REGEX_BACKEND
+
+logger = logging.getLogger(__name__)
+
+# 設定値とモジュール名の対応
+_BACKEND_MODULES: Dict[str, str] = {
+    "stdlib": "re",
+    "regex": "regex",
+}
+
+
+def _load_backend(name: str) -> ModuleType:
+    """設定された正規表現エンジンのモジュールを読み込む.
+
+    Args:
+        name (str): エンジン名（stdlib / regex）
+
+    Returns:
+        ModuleType: reと同じAPIを持つモジュール
+    """
+    module_name = _BACKEND_MODULES.get(name)
+    if module_name is None:
+        logger.warning(f"未対応の正規表現エンジンです: {name}")
+        return re
+
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        logger.warning(f"{module_name} が見つからないため、reを使用します")
+        return re
+
+
+_backend: ModuleType = _load_backend(REGEX_BACKEND)
+
+
+def compile_pattern(pattern: str, flags: int = 0) -> Pattern:
+    """設定された正規表現エンジンでパターンをコンパイルする.
+
+    Args:
+        pattern (str): 正規表現パターン（reの構文）
+        flags (int): reのフラグ
+
+    Returns:
+        Pattern: コンパイル済みのパターン
+    """
+    return _backend.compile(pattern, flags)
+
+
+def trie_alternation(words: Iterable[str]) -> str:
+    """語の一覧から、共通の接頭辞をまとめた選択パターンを作成する.
+
+    例えば「られる」「られた」「れる」は ``(?:られ(?:た|る)|れる)`` となり、
+    共通部分を一度だけ照合すればよくなる。
+
+    Args:
+        words (Iterable[str]): 語の一覧（重複可）
+
+    Returns:
+        str: 正規表現パターン（語が空の場合は空文字列）
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [
+            re.escape(char) + build(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        if "" in node:
+            return f"(?:{'|'.join(branches)})?"
+        if len(branches) == 1:
+            return branches[0]
+        return f"(?:{'|'.join(branches)})"
+
+    return build(trie)
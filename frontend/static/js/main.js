@@ -114,7 +114,8 @@ function displayAnalyzedText(results) {
     container.innerHTML = '';
 
     // 文ごとに処理
-    results.forEach((sentence, sentenceIndex) => {
+    results.forEach((columns, sentenceIndex) => {
+        const sentence = toTokens(columns);
         const sentenceDiv = document.createElement('div');
         sentenceDiv.className = 'mb-4 leading-loose';
 
@@ -158,6 +159,19 @@ function displayAnalyzedText(results) {
     });
 }
 
+// 列指向の分析結果（項目ごとの配列）をトークンの配列に変換する関数
+function toTokens(columns) {
+    return columns.word.map((word, i) => ({
+        word,
+        pos: columns.pos[i],
+        importance: columns.importance[i],
+        color: columns.color[i],
+        language: columns.language[i],
+        is_compound: columns.is_compound[i],
+        original_form: columns.original_form[i],
+    }));
+}
+
 // 単語間にスペースを入れるべきかを判定
 function shouldAddSpace(currentToken, nextToken) {
     if (!currentToken || !nextToken) return false;
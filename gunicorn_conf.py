@@ -0,0 +1,26 @@
+"""gunicornの本番用設定.
+
+起動例:
+    gunicorn -c gunicorn_conf.py wsgi:app
+
+Note:
+    プリフォークした複数ワーカーとスレッドでリクエストを並列に処理する。
+    サービスやDBエンジンは初回利用時に生成されるため、preload_appを
+    有効にしても各ワーカーが個別に保持する。
+"""
+
+import os
+
+# 待ち受けアドレス（コンテナ等から公開するため全インターフェースで待つ）
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")  # noqa: S104
+
+# ワーカー設定
+workers = (os.cpu_count() or 1) * 2 + 1
+worker_class = "gthread"
+threads = 4
+
+# アプリケーションをマスターで読み込み、フォーク後のワーカーで共有する
+preload_app = True
+
+# リクエストのタイムアウト（秒）
+timeout = 60
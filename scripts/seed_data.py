@@ -9,16 +9,21 @@ import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import argparse
+import json
 import logging
-import secrets
+import random
+from collections import Counter
 from datetime import UTC, datetime, timedelta
-from enum import Enum, auto
-from typing import Dict, List, NamedTuple, Tuple
+from enum import IntEnum
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
 
 from faker import Faker
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, delete, event, insert
 from sqlalchemy.orm import Session
 
+from backend.config.settings import SQLITE_PRAGMAS
 from backend.models import Base, Trend
 
 # デバッグ設定
@@ -30,28 +35,67 @@ logger = logging.getLogger(__name__)
 
 # データベース設定
 SQLALCHEMY_DATABASE_URL = "sqlite:///./trends.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, echo=True)
+engine = create_engine(SQLALCHEMY_DATABASE_URL, echo=False)
+
+# 一度きりの投入処理のため、コミットごとのfsyncも省略する
+SEED_PRAGMAS: Dict[str, Any] = {**SQLITE_PRAGMAS, "synchronous": "OFF"}
+
+
+@event.listens_for(engine, "connect")
+def _set_seed_pragmas(dbapi_connection: Any, _: Any) -> None:
+    """新規接続に投入処理用のSQLiteのPRAGMAを設定する.
+
+    Args:
+        dbapi_connection (Any): DBAPIの接続オブジェクト
+        _ (Any): コネクションプールのレコード(未使用)
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in SEED_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
 Base.metadata.create_all(bind=engine)
 
+# 生成済みデータのキャッシュの形式のバージョン（形式を変えたら上げる）
+SEED_CACHE_VERSION = 1
+
 # Faker設定
 fake = Faker(["ja_JP", "en_US"])
 
 
-class KeywordCategory(Enum):
-    """キーワードのカテゴリを定義."""
+@lru_cache(maxsize=None)
+def get_random_keyword_pools() -> Dict[str, List[str]]:
+    """RANDOMカテゴリ用の語彙を生成方法ごとに取得する.
+
+    初回呼び出し時に一度だけFakerで生成し、投稿ごとのFakerのプロバイダ
+    呼び出しを避ける。
+
+    Returns:
+        Dict[str, List[str]]: 生成方法ごとの語彙のリスト
+    """
+    return {
+        "company": [fake.company() for _ in range(512)],
+        "catch_phrase": [fake.catch_phrase() for _ in range(512)],
+        "buzzword": [fake.bs() for _ in range(512)],
+        "hashtag": [fake.word() for _ in range(2048)],
+    }
 
-    TECH = auto()
-    BUSINESS = auto()
-    SOCIAL = auto()
-    RANDOM = auto()
 
+# 投稿ごとの値を生成する乱数生成器（テストデータ用で暗号論的な強度は不要の
+# ため、システムコールを伴うsecretsではなくrandomを使用）
+rng = random.Random()  # noqa: S311
 
-class KeywordData(NamedTuple):
-    """キーワードに関連するデータを格納する構造体."""
 
-    count: int
-    created_at: datetime
-    category: KeywordCategory
+class KeywordCategory(IntEnum):
+    """キーワードのカテゴリを定義."""
+
+    TECH = 0
+    BUSINESS = 1
+    SOCIAL = 2
+    RANDOM = 3
 
 
 # 基本キーワードリスト（カテゴリごとの重要度を追加）
@@ -93,23 +137,77 @@ SOCIAL_KEYWORDS: List[Tuple[str, float]] = [
 ]
 
 
-def weighted_choice(choices: List[str], weights: List[float]) -> str:
-    """重み付きの選択を行う.
+AliasTable = Tuple[List[float], List[int]]
+
+
+def build_alias_table(weights: Sequence[float]) -> AliasTable:
+    """重み付き選択用のエイリアステーブル(Walkerのエイリアス法)を構築する.
 
     Args:
-        choices (List[str]): 選択肢のリスト
-        weights (List[float]): 各選択肢に対応する重みのリスト
+        weights (Sequence[float]): 各選択肢に対応する重みのリスト
 
     Returns:
-        str: 選択された要素
+        AliasTable: 各区画の採択確率と、棄却時に選ぶ選択肢の添字のリスト
     """
-    total = int(sum(weights))
-    cumulative_weights = [sum(weights[: i + 1]) for i in range(len(weights))]
-    rand_val = secrets.randbelow(total)
-    for choice, cumulative_weight in zip(choices, cumulative_weights):
-        if rand_val < cumulative_weight:
-            return choice
-    return choices[-1]  # デフォルトで最後の選択肢を返す
+    size = len(weights)
+    total = sum(weights)
+    scaled = [weight * size / total for weight in weights]
+    probabilities = [1.0] * size
+    aliases = list(range(size))
+
+    small = [i for i, value in enumerate(scaled) if value < 1.0]
+    large = [i for i, value in enumerate(scaled) if value >= 1.0]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        probabilities[less] = scaled[less]
+        aliases[less] = more
+        scaled[more] += scaled[less] - 1.0
+        (small if scaled[more] < 1.0 else large).append(more)
+    return probabilities, aliases
+
+
+def alias_index(table: AliasTable) -> int:
+    """エイリアステーブルから重みに従って添字をO(1)で選択する.
+
+    Args:
+        table (AliasTable): build_alias_tableで構築したテーブル
+
+    Returns:
+        int: 選択された選択肢の添字
+    """
+    probabilities, aliases = table
+    index = rng.randrange(len(probabilities))
+    return index if rng.random() < probabilities[index] else aliases[index]
+
+
+# カテゴリごとの出現確率（選択用のテーブルは読み込み時に一度だけ構築する）
+CATEGORY_WEIGHTS: Dict[KeywordCategory, float] = {
+    KeywordCategory.TECH: 0.35,
+    KeywordCategory.BUSINESS: 0.30,
+    KeywordCategory.SOCIAL: 0.25,
+    KeywordCategory.RANDOM: 0.10,
+}
+CATEGORY_CHOICES: Tuple[KeywordCategory, ...] = tuple(CATEGORY_WEIGHTS)
+CATEGORY_ALIAS_TABLE = build_alias_table(list(CATEGORY_WEIGHTS.values()))
+
+# ランダムなキーワードの生成方法ごとの出現確率
+KEYWORD_STYLE_WEIGHTS: Dict[str, float] = {
+    "company": 0.3,
+    "catch_phrase": 0.3,
+    "hashtag": 0.2,
+    "buzzword": 0.2,
+}
+KEYWORD_STYLE_CHOICES: Tuple[str, ...] = tuple(KEYWORD_STYLE_WEIGHTS)
+KEYWORD_STYLE_ALIAS_TABLE = build_alias_table(
+    list(KEYWORD_STYLE_WEIGHTS.values())
+)
+
+# 固定のキーワード表を持つカテゴリ
+KEYWORD_TABLES: Dict[KeywordCategory, List[Tuple[str, float]]] = {
+    KeywordCategory.TECH: TECH_KEYWORDS,
+    KeywordCategory.BUSINESS: BUSINESS_KEYWORDS,
+    KeywordCategory.SOCIAL: SOCIAL_KEYWORDS,
+}
 
 
 def generate_keyword() -> Tuple[str, KeywordCategory, float]:
@@ -119,56 +217,65 @@ def generate_keyword() -> Tuple[str, KeywordCategory, float]:
         Tuple[str, KeywordCategory, float]:
         キーワード、カテゴリ、重要度係数のタプル
     """
-    category_weights = {
-        KeywordCategory.TECH: 0.35,
-        KeywordCategory.BUSINESS: 0.30,
-        KeywordCategory.SOCIAL: 0.25,
-        KeywordCategory.RANDOM: 0.10,
+    return generate_keywords(1)[0]
+
+
+def generate_keywords(
+    num_keywords: int,
+) -> List[Tuple[str, KeywordCategory, float]]:
+    """キーワードをまとめて生成する.
+
+    先にすべてのカテゴリを決め、固定のキーワード表はカテゴリごとに必要な
+    件数を一度に選択する。
+
+    Args:
+        num_keywords (int): 生成するキーワード数
+
+    Returns:
+        List[Tuple[str, KeywordCategory, float]]:
+        キーワード、カテゴリ、重要度係数のタプルのリスト
+    """
+    categories = [
+        CATEGORY_CHOICES[alias_index(CATEGORY_ALIAS_TABLE)]
+        for _ in range(num_keywords)
+    ]
+    tally = Counter(categories)
+
+    # 固定のキーワード表はFakerを経由せずに直接選択する
+    table_picks = {
+        category: iter(rng.choices(table, k=tally[category]))
+        for category, table in KEYWORD_TABLES.items()
     }
 
-    # secretsを使用してカテゴリを選択
-    total = int(sum(category_weights.values()))
-    choice = secrets.randbelow(total)
-    cumulative = 0
+    keywords = []
+    for category in categories:
+        picks = table_picks.get(category)
+        if picks is None:
+            keywords.append(_generate_random_keyword())
+        else:
+            keyword, importance = next(picks)
+            keywords.append((keyword, category, importance))
+    return keywords
 
-    for _, weight in category_weights.items():
-        cumulative += weight * 100
-        if choice < cumulative:
-            break
 
-    category = weighted_choice(
-        [category.name for category in category_weights],
-        list(category_weights.values()),
-    )
-    category = KeywordCategory[category]  # 文字列からKeywordCategoryに変換
-
-    if category == KeywordCategory.TECH:
-        keyword, importance = fake.random_element(elements=TECH_KEYWORDS)
-        return keyword, category, importance
-    if category == KeywordCategory.BUSINESS:
-        keyword, importance = fake.random_element(elements=BUSINESS_KEYWORDS)
-        return keyword, category, importance
-    if category == KeywordCategory.SOCIAL:
-        keyword, importance = fake.random_element(elements=SOCIAL_KEYWORDS)
-        return keyword, category, importance
+def _generate_random_keyword() -> Tuple[str, KeywordCategory, float]:
+    """RANDOMカテゴリのキーワードを生成する.
+
+    Returns:
+        Tuple[str, KeywordCategory, float]:
+        キーワード、カテゴリ、重要度係数のタプル
+    """
+    category = KeywordCategory.RANDOM
 
     # ランダムなキーワード生成（より多様な生成方法）
-    keyword_style = fake.random_element(
-        elements=[
-            ("company", 0.3),
-            ("catch_phrase", 0.3),
-            ("hashtag", 0.2),
-            ("buzzword", 0.2),
-        ]
-    )
+    keyword_style = KEYWORD_STYLE_CHOICES[
+        alias_index(KEYWORD_STYLE_ALIAS_TABLE)
+    ]
 
-    if keyword_style == "company":
-        return fake.company(), category, 1.0
-    if keyword_style == "catch_phrase":
-        return fake.catch_phrase(), category, 1.0
-    if keyword_style == "buzzword":
-        return fake.bs(), category, 1.0
-    return f"#{fake.word()}", category, 0.8
+    word = rng.choice(get_random_keyword_pools()[keyword_style])
+    if keyword_style == "hashtag":
+        return f"#{word}", category, 0.8
+    return word, category, 1.0
 
 
 def calculate_trend_score(
@@ -186,26 +293,46 @@ def calculate_trend_score(
         float: 計算されたトレンドスコア
     """
     hours_old = (now - created_at).total_seconds() / 3600
+    return calculate_trend_scores([count], [hours_old], [importance])[0]
 
-    # 時間による重み付け（より洗練された減衰関数）
-    time_weight = 1.0 / (1.0 + (hours_old / 12) ** 1.5)
 
-    # 投稿数による対数スケーリング
-    count_weight = (1 + count) ** 0.7
+def calculate_trend_scores(
+    counts: Sequence[int],
+    hours_olds: Sequence[float],
+    importances: Sequence[float],
+) -> List[float]:
+    """複数キーワードのトレンドスコアを1回の走査でまとめて計算する.
 
-    # 最終スコアの計算
-    return round(count_weight * time_weight * importance * 10, 2)
+    Args:
+        counts (Sequence[int]): 投稿数
+        hours_olds (Sequence[float]): 作成からの経過時間（時間単位）
+        importances (Sequence[float]): 重要度係数
+
+    Returns:
+        List[float]: キーワードごとのトレンドスコア
+    """
+    scores = []
+    for count, hours_old, importance in zip(counts, hours_olds, importances):
+        # 時間による重み付け（より洗練された減衰関数）
+        time_weight = 1.0 / (1.0 + (hours_old / 12) ** 1.5)
 
+        # 投稿数による対数スケーリング
+        count_weight = (1 + count) ** 0.7
+
+        # 最終スコアの計算
+        scores.append(round(count_weight * time_weight * importance * 10, 2))
+    return scores
 
-def generate_test_data(session: Session, num_posts: int = 1000) -> None:
-    """テストデータを生成する.
+
+def _sample_posts(num_posts: int) -> Tuple[List[float], List[int]]:
+    """投稿ごとの経過時間と基本の投稿数をまとめて生成する.
 
     Args:
-        session (Session): データベースセッション
         num_posts (int): 生成する投稿数
-    """
-    now = datetime.now(UTC)
 
+    Returns:
+        Tuple[List[float], List[int]]: 経過時間（時間単位）と投稿数のリスト
+    """
     # より細かい投稿の分布を設定
     count_ranges = [
         (1, 30),  # 40%: 一般的な投稿
@@ -215,89 +342,188 @@ def generate_test_data(session: Session, num_posts: int = 1000) -> None:
         (701, 1500),  # 2%: バイラルの投稿
     ]
 
-    # キーワードとの投稿数を追跡
-    keyword_data: Dict[str, KeywordData] = {}
+    # 各範囲の確率（%）
+    count_range_table = build_alias_table([40, 30, 20, 8, 2])
 
+    # より自然な時間分布を生成（0.1-24時間の範囲に制限）
+    hours_samples = [
+        min(max(0.1, abs(rng.gauss(12, 4))), 24) for _ in range(num_posts)
+    ]
+
+    # 投稿数の範囲を決定し（より現実的な分布）、範囲内で一様に投稿数を生成
+    # する（randintの引数検査を避けて一様乱数から直接求める）
+    uniform = rng.random
+    base_counts = []
     for _ in range(num_posts):
-        # より自然な時間分布を生成
-        hours_ago = abs(fake.normal(loc=12, scale=4))
-        hours_ago = min(max(0.1, hours_ago), 24)  # 0.1-24時間の範囲に制限
-        created_at = now - timedelta(hours=hours_ago)
-
-        # キーワードを生成
-        keyword, category, importance = generate_keyword()
-
-        # 投稿数の範囲を決定（より現実的な分布）
-        probability = secrets.randbelow(100)
-        range_index = (
-            0
-            if probability < 40
-            else 1
-            if probability < 70
-            else 2
-            if probability < 90
-            else 3
-            if probability < 98
-            else 4
-        )
-        count_range = count_ranges[range_index]
+        low, high = count_ranges[alias_index(count_range_table)]
+        base_counts.append(low + int(uniform() * (high - low + 1)))
+    return hours_samples, base_counts
 
-        # 投稿数を生成（より自然な分布）
-        base_count = (
-            secrets.randbelow(count_range[1] - count_range[0] + 1)
-            + count_range[0]
-        )
+
+def generate_trend_records(num_posts: int) -> List[Dict[str, Any]]:
+    """投稿を生成してキーワードごとのトレンドのレコードに集計する.
+
+    作成日時は実行時刻に依存しないよう、最新の投稿からの経過時間（時間単位）
+    として返す。
+
+    Args:
+        num_posts (int): 生成する投稿数
+
+    Returns:
+        List[Dict[str, Any]]: キーワード、投稿数、スコア、経過時間、
+        カテゴリを持つレコードのリスト
+    """
+    # キーワードごとの投稿数を追跡（キーワードの添字と、添字ごとの並列リスト
+    # で保持し、更新のたびに構造体を作り直さない）。作成日時は最新の投稿の
+    # 経過時間（時間単位）で保持する
+    keyword_index: Dict[str, int] = {}
+    counts: List[int] = []
+    hours_olds: List[float] = []
+    # カテゴリは整数値としてbytearrayに詰めて保持する
+    categories = bytearray()
+
+    # 投稿ごとの数値はループの前にまとめて生成し、ループではキーワードの
+    # 集計のみを行う
+    hours_samples, base_counts = _sample_posts(num_posts)
+
+    # キーワードもカテゴリごとにまとめて生成
+    keyword_samples = generate_keywords(num_posts)
+
+    for hours_ago, base_count, (keyword, category, importance) in zip(
+        hours_samples, base_counts, keyword_samples
+    ):
         post_count = int(base_count * importance)
 
         # キーワードの出現回数を更新
-        if keyword in keyword_data:
-            current_data = keyword_data[keyword]
-            keyword_data[keyword] = KeywordData(
-                count=current_data.count + post_count,
-                created_at=max(created_at, current_data.created_at),
-                category=current_data.category,
-            )
+        index = keyword_index.get(keyword)
+        if index is None:
+            keyword_index[keyword] = len(counts)
+            counts.append(post_count)
+            hours_olds.append(hours_ago)
+            categories.append(category)
         else:
-            keyword_data[keyword] = KeywordData(
-                count=post_count, created_at=created_at, category=category
-            )
-
-    # トレンドを生成
-    for keyword, data in keyword_data.items():
-        score = calculate_trend_score(
-            data.count,
-            data.created_at,
-            now,
-            importance=1.2 if data.category != KeywordCategory.RANDOM else 1.0,
+            counts[index] += post_count
+            if hours_ago < hours_olds[index]:
+                hours_olds[index] = hours_ago
+
+    # トレンドのスコアを全キーワード分まとめて計算
+    scores = calculate_trend_scores(
+        counts,
+        hours_olds,
+        [
+            1.2 if category != KeywordCategory.RANDOM else 1.0
+            for category in categories
+        ],
+    )
+
+    return [
+        {
+            "keyword": keyword,
+            "count": count,
+            "score": score,
+            "hours_old": hours_old,
+            "category": category,
+        }
+        for keyword, count, score, hours_old, category in zip(
+            keyword_index, counts, scores, hours_olds, categories
         )
+    ]
+
+
+def _seed_cache_path(num_posts: int) -> str:
+    """生成済みレコードのキャッシュファイルのパスを取得する.
+
+    Args:
+        num_posts (int): 生成する投稿数
+
+    Returns:
+        str: キャッシュファイルのパス
+    """
+    return f"./.seed_cache_v{SEED_CACHE_VERSION}_{num_posts}.json"
 
-        trend = Trend(
-            keyword=keyword,
-            count=data.count,
-            score=score,
-            created_at=data.created_at,
+
+def load_trend_records(
+    num_posts: int, force_regen: bool = False
+) -> List[Dict[str, Any]]:
+    """トレンドのレコードをキャッシュから読み込み、なければ生成して保存する.
+
+    Args:
+        num_posts (int): 生成する投稿数
+        force_regen (bool): キャッシュを無視して再生成するかどうか
+
+    Returns:
+        List[Dict[str, Any]]: トレンドのレコードのリスト
+    """
+    cache_path = _seed_cache_path(num_posts)
+    if not force_regen and os.path.exists(cache_path):
+        with open(cache_path, encoding="utf-8") as cache_file:
+            cache = json.load(cache_file)
+        if cache.get("version") == SEED_CACHE_VERSION:
+            logger.info(f"キャッシュ済みのデータを使用します: {cache_path}")
+            return cache["records"]
+
+    records = generate_trend_records(num_posts)
+    with open(cache_path, "w", encoding="utf-8") as cache_file:
+        json.dump(
+            {"version": SEED_CACHE_VERSION, "records": records},
+            cache_file,
+            ensure_ascii=False,
         )
-        session.add(trend)
+    return records
+
+
+def generate_test_data(
+    session: Session, num_posts: int = 1000, force_regen: bool = False
+) -> None:
+    """テストデータを生成する.
+
+    Args:
+        session (Session): データベースセッション
+        num_posts (int): 生成する投稿数
+        force_regen (bool): キャッシュを無視して再生成するかどうか
+    """
+    now = datetime.now(UTC)
+    records = load_trend_records(num_posts, force_regen)
+
+    # トレンドを生成（ORMの一括INSERTで1回のexecuteにまとめる）
+    rows = [
+        {
+            "keyword": record["keyword"],
+            "count": record["count"],
+            "score": record["score"],
+            "created_at": now - timedelta(hours=record["hours_old"]),
+        }
+        for record in records
+    ]
+    if rows:
+        session.execute(insert(Trend), rows)
 
     session.commit()
     logger.info(
-        f"{num_posts}件の投稿から{len(keyword_data)}件のトレンドを生成しました"
+        f"{num_posts}件の投稿から{len(rows)}件のトレンドを生成しました"
     )
 
     # カテゴリごとの統計を出力
-    category_stats = {category: 0 for category in KeywordCategory}
-    for data in keyword_data.values():
-        category_stats[data.category] += 1
-
-    for category, count in category_stats.items():
-        logger.info(f"{category.name}: {count}件")
+    category_stats = Counter(record["category"] for record in records)
+    for category in KeywordCategory:
+        logger.info(f"{category.name}: {category_stats[category]}件")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="テストデータを生成する")
+    parser.add_argument(
+        "--force-regen",
+        action="store_true",
+        help="キャッシュを使用せずにデータを再生成する",
+    )
+    args = parser.parse_args()
+
     with Session(engine) as session:
-        # 既存のデータをクリア
-        session.query(Trend).delete()
-        session.commit()
+        # 既存のデータをクリア（生成データの挿入と同じトランザクションで
+        # コミットする）
+        session.execute(delete(Trend))
 
         # 1000投稿分のデータを生成
-        generate_test_data(session, num_posts=1000)
+        generate_test_data(
+            session, num_posts=1000, force_regen=args.force_regen
+        )
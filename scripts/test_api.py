@@ -1,14 +1,16 @@
 import requests
 
+SESSION = requests.Session()
+SESSION.headers.update({"Content-Type": "application/json"})
+
 
 def test_analyze():
     url = "http://localhost:8000/api/analyze"
-    headers = {"Content-Type": "application/json"}
     data = {
         "text": "私はPythonでAIアプリケーションを開発しています。I love programming!"
     }
 
-    response = requests.post(url, json=data, headers=headers)
+    response = SESSION.post(url, json=data)
     print(f"Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
 
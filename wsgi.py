@@ -0,0 +1,14 @@
+"""WSGIエントリーポイント.
+
+本番環境ではFlaskの開発サーバーではなく、gunicornから起動する。
+
+起動例:
+    gunicorn -c gunicorn_conf.py wsgi:app
+
+Note:
+    ワーカー数やスレッド数はgunicorn_conf.pyで設定する。
+"""
+
+from app import app
+
+application = app